@@ -1,8 +1,10 @@
+import functools
 import re
 import uuid
 from pathlib import Path
 from tracemalloc import Traceback
-from snowflake.snowpark import DataFrame, QueryHistory, Row, Session, Table
+from typing import Literal, cast, overload
+from snowflake.snowpark import AsyncJob, DataFrame, QueryHistory, Row, Session, Table
 from datamart_analytics.connector.base_snowpark import BaseSnowparkConnector
 from datamart_analytics.custom_exceptions.snowflake_exceptions import (
     SnowflakeCredentialException,
@@ -19,7 +21,7 @@ from datamart_analytics.definitions.custom_definitions import (
     SnowparkTableWriteMode,
     UpsertResultStatus,
 )
-from datamart_analytics.environment import environment_configuration
+from datamart_analytics.environment import get_env
 from datamart_analytics.logger import d_logger, logger
 from datamart_analytics.models.custom_models import (
     DatamartTable,
@@ -32,6 +34,36 @@ from datamart_analytics.operations.obfuscation_operations import (
 )
 
 
+def _read_sql_file(sql_file_path: Path) -> str:
+    """
+    Read a SQL file, reusing the cached text until the file is modified.
+
+    Params:
+        sql_file_path (Path): Path of the SQL file.
+
+    Returns:
+        str: The raw SQL text.
+    """
+    return _read_sql_file_cached(sql_file_path, sql_file_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_sql_file_cached(sql_file_path: Path, mtime_ns: int) -> str:
+    """
+    Read a SQL file; cached per (path, mtime_ns) by _read_sql_file, so placeholders
+    are substituted per call on the cached text and edited files are re-read.
+
+    Params:
+        sql_file_path (Path): Path of the SQL file.
+        mtime_ns (int): Modification time of the file, part of the cache key only.
+
+    Returns:
+        str: The raw SQL text.
+    """
+    with open(sql_file_path, "r") as file:
+        return file.read()
+
+
 class SnowparkConnector(BaseSnowparkConnector):
     """
     A class to represent a Snowpark query.
@@ -45,7 +77,7 @@ class SnowparkConnector(BaseSnowparkConnector):
             SnowparkConnector: The current instance of SnowparkConnector.
         """
         if (
-            environment_configuration.datamart_analytics_framework_environment
+            get_env().datamart_analytics_framework_environment
             != ApplicationEnvironment.TEST.value
         ):
             if all(
@@ -337,8 +369,7 @@ class SnowparkConnector(BaseSnowparkConnector):
             else:
                 sql_file_path = sql_base_path / f"{file_name}.sql"
 
-            with open(sql_file_path, "r") as file:
-                query = file.read()
+            query = _read_sql_file(sql_file_path)
 
             if query is None:
                 raise SnowflakeQueryException("Query could not be loaded.")
@@ -463,13 +494,35 @@ class SnowparkConnector(BaseSnowparkConnector):
             logger.error(f"Error executing query from file: {e}")
         return result
 
+    @overload
+    def save_as_table(
+        self,
+        dataframe: DataFrame,
+        table_name: str,
+        write_mode: SnowparkTableWriteMode = ...,
+        table_type: SnowparkTableType = ...,
+        block: Literal[True] = ...,
+    ) -> None: ...
+
+    @overload
+    def save_as_table(
+        self,
+        dataframe: DataFrame,
+        table_name: str,
+        write_mode: SnowparkTableWriteMode = ...,
+        table_type: SnowparkTableType = ...,
+        *,
+        block: Literal[False],
+    ) -> AsyncJob: ...
+
     def save_as_table(
         self,
         dataframe: DataFrame,
         table_name: str,
         write_mode: SnowparkTableWriteMode = SnowparkTableWriteMode.OVERWRITE,
         table_type: SnowparkTableType = SnowparkTableType.PERMANENT,
-    ) -> None:
+        block: bool = True,
+    ) -> AsyncJob | None:
         """
         Save a DataFrame as a Snowflake table.
 
@@ -478,6 +531,11 @@ class SnowparkConnector(BaseSnowparkConnector):
             table_name (str): The name of the table to create or overwrite.
             write_mode (SnowparkTableWriteMode): The write mode for saving the table.
             table_type (SnowparkTableType): The type of the table (temporary, transient, or permanent).
+            block (bool): If False, submit the write asynchronously and return its AsyncJob
+                so several independent writes can run on the warehouse at once.
+
+        Returns:
+            AsyncJob | None: The submitted job when block is False, otherwise None.
 
         Raises:
             Exception: If the session is not initialized or if there is an error during saving.
@@ -489,16 +547,20 @@ class SnowparkConnector(BaseSnowparkConnector):
 
         try:
             if table_type == SnowparkTableType.PERMANENT:
-                dataframe.write.mode(write_mode.value).save_as_table(
-                    table_name=table_name,
+                job = dataframe.write.mode(write_mode.value).save_as_table(
+                    table_name=table_name, block=block
                 )
             else:
-                dataframe.write.mode(write_mode.value).save_as_table(
-                    table_name=table_name, table_type=table_type.value
+                # Only TEMPORARY and TRANSIENT reach here; Snowpark types table_type as a Literal
+                job = dataframe.write.mode(write_mode.value).save_as_table(
+                    table_name=table_name,
+                    table_type=cast(Literal["temporary", "transient"], table_type.value),
+                    block=block,
                 )
             d_logger.debug(
-                f"DataFrame saved as table {table_name} with mode {write_mode.value} and type {table_type.value}"
+                f"DataFrame {'saved' if block else 'submitted'} as table {table_name} with mode {write_mode.value} and type {table_type.value}"
             )
+            return None if block else job
         except Exception as e:
             logger.error(
                 f"Error saving DataFrame as table for table {table_name}. Error: {e}"
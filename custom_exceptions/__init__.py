@@ -32,6 +32,7 @@ Exception Hierarchy:
         - SQLTemplateNotFoundException
         - TestCaseValidationException
         - OneOrMoreTestCasesFailedException
+        - NoTestResultsException
 """
 
 from datamart_analytics.custom_exceptions.claim_status_exceptions import (
@@ -59,6 +60,7 @@ from datamart_analytics.custom_exceptions.test_framework_exceptions import (
     LoadTestException,
     LoggingInitializationException,
     NoRowsValidatedException,
+    NoTestResultsException,
     OneOrMoreTestCasesFailedException,
     SQLFileNotFoundException,
     SQLTemplateNotFoundException,
@@ -96,4 +98,5 @@ __all__ = [
     "SQLTemplateNotFoundException",
     "TestCaseValidationException",
     "OneOrMoreTestCasesFailedException",
+    "NoTestResultsException",
 ]
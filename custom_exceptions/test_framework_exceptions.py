@@ -105,3 +105,12 @@ class OneOrMoreTestCasesFailedException(TestFrameworkException):
 
     def __init__(self, message: str):
         super().__init__(message)
+
+
+class NoTestResultsException(TestFrameworkException):
+    """
+    Raised when there are no test results to analyze.
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
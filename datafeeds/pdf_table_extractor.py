@@ -1,27 +1,57 @@
 """
 PDF Table Extractor
-Parses tables from PDF files and converts them to Excel or CSV format.
+Parses tables from PDF files and converts them to Excel, CSV or Parquet format.
 
 This script supports multiple PDF table extraction libraries for maximum compatibility:
 - pdfplumber (default, best for most PDFs)
 - tabula-py (Java-based, good for complex layouts)
 - camelot-py (best for lattice/stream tables)
+- fast-miner (pdfminer.six only, fast path for borderless text-grid reports)
 
 Usage:
     python pdf_table_extractor.py --input report.pdf --output report.xlsx
     python pdf_table_extractor.py --input report.pdf --output report.csv --format csv
+    python pdf_table_extractor.py --input report.pdf --output report.parquet --format parquet
     python pdf_table_extractor.py --input report.pdf --output report.xlsx --library tabula
 """
 
 import argparse
+import csv
+import hashlib
+import io
+import itertools
+import json
 import logging
+import multiprocessing
+import os
+import pickle
+import re
 import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Literal
+from typing import Any, Literal, TypeVar, cast
+import numpy as np
 import pandas as pd
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 
+# Optional: Arrow-backed DataFrames and fast CSV writes (falls back to pandas)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+# Optional: zstd-compressed extraction cache entries (falls back to plain pickle)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Configure logging
 logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -30,12 +60,364 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Excel styles, built once and registered per workbook as named styles
+_HEADER_FONT = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
+_HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+_HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
+_DATA_FONT = Font(name='Calibri', size=10)
+_DATA_ALIGNMENT = Alignment(horizontal='left', vertical='center')
+
+_BORDER_SIDE = Side(style='thin', color='D3D3D3')
+_CELL_BORDER = Border(left=_BORDER_SIDE, right=_BORDER_SIDE, top=_BORDER_SIDE, bottom=_BORDER_SIDE)
+
+_HEADER_STYLE_NAME = 'pdf_header'
+_DATA_STYLE_NAME = 'pdf_data'
+
+T = TypeVar('T')
+
+# String dtype for vectorized cell scans: Arrow-backed (RE2 regex kernels) when available
+_CELL_STRING_DTYPE = pd.StringDtype('pyarrow') if pa is not None else pd.StringDtype()
+
+# Numbers whose text a float reproduces exactly: no currency symbols, thousands
+# separators, leading zeros ("007") or trailing decimal zeros ("1.50")
+_PLAIN_NUMBER_PATTERN = r'^(?:0|-?[1-9]\d*(?:\.\d*[1-9])?|-?0\.\d*[1-9])$'
+
+# Digits a float64 holds exactly; longer values (policy/account IDs) stay text
+_MAX_NUMERIC_DIGITS = 15
+
+# Leading or trailing whitespace in a cell value
+_EDGE_WHITESPACE_PATTERN = re.compile(r'^\s|\s$')
+
+# Characters that make pandas' minimal-quoting CSV writer quote a cell
+_CSV_QUOTE_PATTERN = r'[,"\r\n]'
+
+
+def _file_digest(path: Path) -> str:
+    """
+    Hash a file's contents, streamed in 1 MiB chunks.
+    
+    Uses blake3 (SIMD-accelerated) when installed, otherwise SHA-256.
+    
+    Args:
+        path: File to hash
+    
+    Returns:
+        Hex digest prefixed with the algorithm name
+    """
+    try:
+        import blake3
+        hasher, algorithm = blake3.blake3(), 'blake3'
+    except ImportError:
+        hasher, algorithm = hashlib.sha256(), 'sha256'
+    
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            hasher.update(chunk)
+    
+    return f"{algorithm}:{hasher.hexdigest()}"
+
+
+def _rows_to_dataframe(rows: list[list], columns: list) -> pd.DataFrame:
+    """
+    Build a DataFrame from pdfplumber's row lists via a single 2-D object array.
+    
+    pandas wraps the array as one block instead of transposing the list of rows
+    in Python. Short (ragged) rows are padded with None.
+    
+    Args:
+        rows: Table rows as lists of cell values
+        columns: Column headers
+    
+    Returns:
+        DataFrame with the given columns
+    """
+    num_cols = len(columns)
+    if not rows or any(len(row) > num_cols for row in rows):
+        # Nothing to transpose, or malformed rows: keep pandas' own handling/errors
+        return pd.DataFrame(rows, columns=columns)
+    
+    values = np.full((len(rows), num_cols), None, dtype=object)
+    if all(len(row) == num_cols for row in rows):
+        values[:] = rows
+    else:
+        for row_idx, row in enumerate(rows):
+            values[row_idx, :len(row)] = row
+    return pd.DataFrame(values, columns=columns)
+
+
+def _extract_tables_from_pages(pdf, page_indices: Iterable[int], table_settings: dict) -> list[tuple[int, int, list]]:
+    """
+    Extract raw tables from the given pages of an open pdfplumber document.
+    
+    The document handle is shared by all pages; each page's parsed layout is
+    released once its tables are extracted, so memory stays at about one page.
+    
+    Args:
+        pdf: Open pdfplumber PDF
+        page_indices: Zero-based indices into pdf.pages to process
+        table_settings: pdfplumber table detection settings
+    
+    Returns:
+        List of (page_num, table_num, raw_table) tuples (1-based numbering)
+    """
+    raw_tables = []
+    for page_idx in page_indices:
+        page = pdf.pages[page_idx]
+        page_num = page.page_number  # Document page number, also when opened with pages=
+        logger.info(f"Processing page {page_num}")
+        
+        # Extract tables from page, then drop its cached chars/objects
+        page_tables = page.extract_tables(table_settings=table_settings)
+        page.close()
+        for table_num, table in enumerate(page_tables or [], start=1):
+            raw_tables.append((page_num, table_num, table))
+    
+    return raw_tables
+
+
+def _extract_page_range(pdf_path: str, page_indices: list[int], table_settings: dict) -> list[tuple[int, int, list]]:
+    """Worker entry point: open the PDF once and extract raw tables from a page range."""
+    import pdfplumber
+    
+    # Only this worker's pages get Page objects
+    pages = [page_idx + 1 for page_idx in page_indices]
+    with pdfplumber.open(io.BytesIO(Path(pdf_path).read_bytes()), pages=pages) as pdf:
+        return _extract_tables_from_pages(pdf, range(len(pdf.pages)), table_settings)
+
+
+def _iter_pdfminer_chars(layout) -> Iterator:
+    """Yield the LTChar objects of a pdfminer layout, descending into containers (e.g. figures)."""
+    from pdfminer.layout import LTChar
+    
+    for element in layout:
+        if isinstance(element, LTChar):
+            yield element
+        elif hasattr(element, '__iter__'):
+            yield from _iter_pdfminer_chars(element)
+
+
+def _chars_to_rows(chars: list, row_tolerance: float, cell_gap: float) -> list[list]:
+    """
+    Rebuild a text-grid table from positioned characters.
+    
+    Characters are grouped into rows by their top edge, split into cells at
+    horizontal gaps wider than `cell_gap` x font size, and cells are assigned to
+    columns by the page-wide union of cell x-extents (overlapping cells share a
+    column, so left- and right-aligned columns both line up).
+    
+    Args:
+        chars: pdfminer LTChar objects of one page
+        row_tolerance: Maximum top-edge difference (points) within one row
+        cell_gap: Minimum gap between cells, as a fraction of the font size
+    
+    Returns:
+        Table rows (lists of cell strings); empty when the page has no text
+    """
+    chars = [char for char in chars if not char.get_text().isspace()]
+    if not chars:
+        return []
+    
+    x0 = np.fromiter((char.x0 for char in chars), dtype=float, count=len(chars))
+    x1 = np.fromiter((char.x1 for char in chars), dtype=float, count=len(chars))
+    top = np.fromiter((char.y1 for char in chars), dtype=float, count=len(chars))
+    size = np.fromiter((char.size for char in chars), dtype=float, count=len(chars))
+    text = np.array([char.get_text() for char in chars], dtype=object)
+    
+    # Rows: sort top-down and start a new row wherever the top edge jumps
+    by_top = np.argsort(-top, kind='stable')
+    row_of = np.empty(len(chars), dtype=np.intp)
+    row_of[by_top] = np.concatenate(([0], np.cumsum(np.diff(-top[by_top]) > row_tolerance)))
+    
+    # Cells: within each row (left to right), start a new cell at wide gaps
+    order = np.lexsort((x0, row_of))
+    x0, x1, size, text, row_of = x0[order], x1[order], size[order], text[order], row_of[order]
+    gaps = x0[1:] - x1[:-1]
+    new_row = row_of[1:] != row_of[:-1]
+    cell_starts = np.flatnonzero(np.concatenate(([True], new_row | (gaps > cell_gap * size[1:]))))
+    cell_ends = np.append(cell_starts[1:], len(chars))
+    
+    # Word breaks inside a cell: gaps wider than a typical space's share of the font size
+    word_break = np.concatenate((gaps > 0.15 * size[1:], [False]))
+    cell_text = [
+        ''.join(
+            f"{char} " if word_break[idx] and idx + 1 < end else char
+            for idx, char in zip(range(start, end), text[start:end])
+        )
+        for start, end in zip(cell_starts, cell_ends)
+    ]
+    cell_row = row_of[cell_starts]
+    cell_x0 = x0[cell_starts]
+    cell_x1 = np.maximum.reduceat(x1, cell_starts)
+    
+    # Columns: union of overlapping cell extents across the page
+    by_x = np.argsort(cell_x0, kind='stable')
+    reach = np.maximum.accumulate(cell_x1[by_x])
+    column_edges = cell_x0[by_x][np.concatenate(([True], cell_x0[by_x][1:] > reach[:-1]))]
+    cell_col = np.searchsorted(column_edges, cell_x0, side='right') - 1
+    
+    grid = np.full((cell_row.max() + 1, len(column_edges)), '', dtype=object)
+    for row_idx, col_idx, value in zip(cell_row, cell_col, cell_text):
+        grid[row_idx, col_idx] = f"{grid[row_idx, col_idx]} {value}" if grid[row_idx, col_idx] else value
+    return cast(list[list[Any]], grid.tolist())
+
+
+def _extract_pdfminer_page_range(
+    pdf_path: str, page_indices: list[int] | None, row_tolerance: float, cell_gap: float
+) -> list[tuple[int, int, list]]:
+    """
+    Worker entry point: rebuild one text-grid table per page straight from pdfminer.
+    
+    Args:
+        pdf_path: Path to the PDF
+        page_indices: Zero-based page indices to process (None for all pages)
+        row_tolerance: See _chars_to_rows
+        cell_gap: See _chars_to_rows
+    
+    Returns:
+        List of (page_num, table_num, raw_table) tuples (1-based numbering)
+    """
+    from pdfminer.high_level import extract_pages
+    
+    # laparams=None skips pdfminer's layout analysis; rows and cells are rebuilt from chars
+    pages = extract_pages(
+        io.BytesIO(Path(pdf_path).read_bytes()), page_numbers=page_indices, laparams=None
+    )
+    page_nums = (idx + 1 for idx in page_indices) if page_indices is not None else itertools.count(1)
+    
+    raw_tables = []
+    for page_num, page in zip(page_nums, pages):
+        logger.info(f"Processing page {page_num}")
+        rows = _chars_to_rows(list(_iter_pdfminer_chars(page)), row_tolerance, cell_gap)
+        if rows:
+            raw_tables.append((page_num, 1, rows))
+    
+    return raw_tables
+
+
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Create the page-extraction process pool with an explicit start method.
+    
+    On Linux, 'fork' is pinned: workers inherit the already-imported pandas and
+    pdfplumber instead of re-importing them, which 'forkserver' (the default from
+    Python 3.14) and 'spawn' must do. The parent runs no threads while the pool
+    is alive. Other platforms keep their default ('spawn'; fork is unsafe on macOS).
+    """
+    mp_context = multiprocessing.get_context('fork') if sys.platform == 'linux' else None
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+
+def _page_ranges(num_pages: int, workers: int) -> list[list[int]]:
+    """
+    Split zero-based page indices into at most `workers` contiguous ranges.
+    
+    Contiguous ranges keep each worker on neighbouring pages, so results merge
+    back into document order by concatenating the ranges in sequence.
+    """
+    workers = max(1, min(workers, num_pages))
+    chunk_size = -(-num_pages // workers)  # Ceiling division
+    return [
+        list(range(start, min(start + chunk_size, num_pages)))
+        for start in range(0, num_pages, chunk_size)
+    ]
+
+
+def _page_spec(page_indices: list[int]) -> str:
+    """Format a contiguous zero-based page range as a tabula/camelot `pages` string."""
+    return f"{page_indices[0] + 1}-{page_indices[-1] + 1}"
+
+
+def _read_tabula_pages(pdf_path: str, pages: str) -> list[pd.DataFrame]:
+    """
+    Worker entry point: read tables with tabula-py, falling back to stream mode.
+    
+    Args:
+        pdf_path: Path to the PDF
+        pages: tabula `pages` value ('all' or a range such as '1-5')
+    
+    Returns:
+        List of raw DataFrames in page order
+    """
+    import tabula
+    
+    tables = tabula.read_pdf(
+        pdf_path,
+        pages=pages,
+        multiple_tables=True,
+        lattice=True,  # Use lattice mode for tables with borders
+        stream=False   # Use stream mode for tables without borders if lattice fails
+    )
+    
+    if not tables:
+        logger.warning(f"No tables found on pages {pages}. Trying stream mode...")
+        tables = tabula.read_pdf(
+            pdf_path,
+            pages=pages,
+            multiple_tables=True,
+            lattice=False,
+            stream=True
+        )
+    
+    return cast(list[pd.DataFrame], tables)
+
+
+def _read_camelot_pages(pdf_path: str, pages: str) -> list[tuple[int, float, pd.DataFrame]]:
+    """
+    Worker entry point: read tables with camelot-py, falling back to stream mode.
+    
+    Args:
+        pdf_path: Path to the PDF
+        pages: camelot `pages` value ('all' or a range such as '1-5')
+    
+    Returns:
+        List of (page_num, accuracy, raw_df) tuples in page order
+    """
+    import camelot
+    
+    # Try lattice mode first (for tables with borders)
+    tables = camelot.read_pdf(pdf_path, pages=pages, flavor='lattice')
+    
+    if len(tables) == 0:
+        logger.warning(f"No tables found with lattice mode on pages {pages}. Trying stream mode...")
+        tables = camelot.read_pdf(pdf_path, pages=pages, flavor='stream')
+    
+    # Plain tuples: camelot Table objects do not pickle reliably across processes
+    return [(int(table.page), table.accuracy, table.df) for table in tables]
+
 
 class PDFTableExtractor:
     """Extract tables from PDF files using multiple extraction methods."""
     
-    SUPPORTED_LIBRARIES = ['pdfplumber', 'tabula', 'camelot']
-    SUPPORTED_FORMATS = ['excel', 'csv']
+    SUPPORTED_LIBRARIES = ['pdfplumber', 'tabula', 'camelot', 'fast-miner']
+    SUPPORTED_FORMATS = ['excel', 'csv', 'parquet']
+    
+    # Extraction cache location (used with use_cache=True / --cache)
+    CACHE_DIR = Path.home() / '.cache' / 'pdf_table_extractor'
+    
+    # Maximum threads used to write separate CSV/Parquet files concurrently
+    OUTPUT_WRITER_THREADS = 4
+    
+    # Parquet output: zstd pages and 64K-row groups (Snowflake COPY INTO splits work per row group)
+    PARQUET_COMPRESSION = 'zstd'
+    PARQUET_ROW_GROUP_SIZE = 64 * 1024
+    
+    # Cells containing any of these (case-insensitive) count towards the summary-table heuristic
+    SUMMARY_KEYWORDS = ('total', 'summary', 'subtotal', 'grand total', 'sum', 'aggregate')
+    
+    # Single alternation over all keywords; on Arrow strings this runs in RE2 (a DFA), one pass per cell
+    SUMMARY_KEYWORDS_PATTERN = '|'.join(re.escape(keyword) for keyword in SUMMARY_KEYWORDS)
+    
+    # fast-miner text-grid rebuild: row snap (points) and minimum cell gap (fraction of font size)
+    FAST_MINER_ROW_TOLERANCE = 3.0
+    FAST_MINER_CELL_GAP = 0.6
+    
+    # Default pdfplumber table detection settings (override with table_settings / --table-settings)
+    PDFPLUMBER_TABLE_SETTINGS = {
+        'vertical_strategy': 'lines',
+        'horizontal_strategy': 'lines',
+        'snap_tolerance': 3,
+    }
     
     def __init__(
         self, 
@@ -45,19 +427,38 @@ class PDFTableExtractor:
         output_format: str = 'excel',
         combine_tables: bool = True,
         detail_only: bool = True,
-        min_detail_rows: int = 10
+        min_detail_rows: int = 10,
+        workers: int = 1,
+        use_cache: bool = False,
+        table_settings: dict | None = None,
+        infer_numeric: bool = False,
+        drop_repeated_headers: bool = False,
+        force_refresh: bool = False,
+        flush_every: int = 50
     ):
         """
         Initialize PDF table extractor.
         
         Args:
             input_pdf: Path to input PDF file
-            output_file: Path to output file (Excel or CSV)
-            library: Extraction library to use ('pdfplumber', 'tabula', 'camelot')
-            output_format: Output format ('excel' or 'csv')
+            output_file: Path to output file (Excel, CSV or Parquet)
+            library: Extraction library to use ('pdfplumber', 'tabula', 'camelot', 'fast-miner')
+            output_format: Output format ('excel', 'csv' or 'parquet')
             combine_tables: If True, combine all tables into one (default: True)
             detail_only: If True, extract only detail tables (not summaries) (default: True)
             min_detail_rows: Minimum rows to be considered detail data (default: 10)
+            workers: Worker processes for page extraction, each handling a
+                contiguous page range (default: 1)
+            use_cache: If True, reuse cached extraction results for identical PDFs (default: False)
+            table_settings: pdfplumber table settings (default: PDFPLUMBER_TABLE_SETTINGS)
+            infer_numeric: If True, write columns holding only plain numbers as numeric
+                instead of text (default: False)
+            drop_repeated_headers: If True, drop the first row of a continuation table when
+                it repeats the header row of the table it continues (default: False)
+            force_refresh: If True with use_cache, ignore any cached entry and
+                re-extract, overwriting it (default: False)
+            flush_every: With separate tables, write CSV/Parquet files in batches of
+                this many tables while extraction continues (default: 50)
         """
         self.input_pdf = Path(input_pdf)
         self.output_file = Path(output_file)
@@ -66,6 +467,13 @@ class PDFTableExtractor:
         self.combine_tables = combine_tables
         self.detail_only = detail_only
         self.min_detail_rows = min_detail_rows
+        self.workers = workers
+        self.use_cache = use_cache
+        self.table_settings = table_settings if table_settings is not None else dict(self.PDFPLUMBER_TABLE_SETTINGS)
+        self.infer_numeric = infer_numeric
+        self.drop_repeated_headers = drop_repeated_headers
+        self.force_refresh = force_refresh
+        self.flush_every = flush_every
         
         # Validate inputs
         self._validate_inputs()
@@ -93,16 +501,41 @@ class PDFTableExtractor:
                 f"Choose from: {', '.join(self.SUPPORTED_FORMATS)}"
             )
         
+        if self.workers < 1:
+            raise ValueError(f"Workers must be at least 1, got {self.workers}")
+        
+        if self.flush_every < 1:
+            raise ValueError(f"Flush interval must be at least 1 table, got {self.flush_every}")
+        
+        if not isinstance(self.table_settings, dict):
+            raise ValueError(f"Table settings must be a JSON object, got: {self.table_settings!r}")
+        
         # Create output directory if it doesn't exist
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    def extract_tables(self) -> List[pd.DataFrame]:
+    def extract_tables(self) -> list[pd.DataFrame]:
         """
         Extract all tables from PDF using specified library.
         
         Returns:
             List of DataFrames, one per table found
         
+        Raises:
+            ImportError: If required library is not installed
+            Exception: If extraction fails
+        """
+        return list(self.iter_tables())
+    
+    def iter_tables(self) -> Iterator[pd.DataFrame]:
+        """
+        Extract tables from PDF, yielding each one as soon as it is ready.
+        
+        With pdfplumber each DataFrame is built, cleaned and filtered lazily, so
+        callers that write tables one at a time never hold them all in memory.
+        
+        Returns:
+            Iterator of DataFrames, one per table found
+        
         Raises:
             ImportError: If required library is not installed
             Exception: If extraction fails
@@ -113,14 +546,21 @@ class PDFTableExtractor:
         if self.library == 'pdfplumber':
             return self._extract_with_pdfplumber()
         elif self.library == 'tabula':
-            return self._extract_with_tabula()
+            return iter(self._classify_tables(self._load_or_extract(self._extract_with_tabula)))
         elif self.library == 'camelot':
-            return self._extract_with_camelot()
+            return iter(self._classify_tables(self._load_or_extract(self._extract_with_camelot)))
+        elif self.library == 'fast-miner':
+            return self._extract_with_pdfminer()
         else:
             raise ValueError(f"Unsupported library: {self.library}")
     
-    def _extract_with_pdfplumber(self) -> List[pd.DataFrame]:
-        """Extract tables using pdfplumber library."""
+    def _extract_raw_pdfplumber_tables(self) -> list[tuple[int, int, list]]:
+        """
+        Extract raw pdfplumber tables from every page, serially or with a process pool.
+        
+        Returns:
+            List of (page_num, table_num, raw_table) tuples in page order
+        """
         try:
             import pdfplumber
         except ImportError:
@@ -128,76 +568,271 @@ class PDFTableExtractor:
                 "pdfplumber not installed. Install with: pip install pdfplumber"
             )
         
-        tables = []
+        # Parse from an in-memory buffer so pdfplumber's random access hits RAM, not the file handle
+        pdf_bytes = self.input_pdf.read_bytes()
+        
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            num_pages = len(pdf.pages)
+            logger.info(f"PDF has {num_pages} pages")
+            
+            if self.workers <= 1 or num_pages <= 1:
+                raw_tables = _extract_tables_from_pages(
+                    pdf, range(num_pages), self.table_settings
+                )
+        
+        if self.workers > 1 and num_pages > 1:
+            raw_tables = self._extract_pages_in_parallel(
+                num_pages, _extract_page_range, self.table_settings
+            )
+        
+        return raw_tables
+    
+    def _extract_raw_pdfminer_tables(self) -> list[tuple[int, int, list]]:
+        """
+        Rebuild one text-grid table per page directly from pdfminer characters.
+        
+        Returns:
+            List of (page_num, table_num, raw_table) tuples in page order
+        """
+        try:
+            import pdfminer
+        except ImportError:
+            raise ImportError(
+                "pdfminer.six not installed. Install with: pip install pdfminer.six"
+            )
+        
+        num_pages = self._count_pages() if self.workers > 1 else None
+        if num_pages and num_pages > 1:
+            return self._extract_pages_in_parallel(
+                num_pages,
+                _extract_pdfminer_page_range,
+                self.FAST_MINER_ROW_TOLERANCE,
+                self.FAST_MINER_CELL_GAP,
+            )
+        
+        return _extract_pdfminer_page_range(
+            str(self.input_pdf), None, self.FAST_MINER_ROW_TOLERANCE, self.FAST_MINER_CELL_GAP
+        )
+    
+    def _extract_with_pdfplumber(self) -> Iterator[pd.DataFrame]:
+        """Extract tables using pdfplumber library, yielding each table as it is built."""
+        # Raw tables are cached, so detail filtering options can change between runs
+        return self._tables_from_raw(self._load_or_extract(self._extract_raw_pdfplumber_tables))
+    
+    def _extract_with_pdfminer(self) -> Iterator[pd.DataFrame]:
+        """
+        Extract text-grid tables with pdfminer.six alone (library 'fast-miner').
+        
+        Skips pdfplumber's table detection and pdfminer's layout analysis: each page
+        is treated as one table whose rows and columns are rebuilt from character
+        positions. Suited to plain text-grid reports, not pages mixing prose and tables.
+        """
+        return self._tables_from_raw(self._load_or_extract(self._extract_raw_pdfminer_tables))
+    
+    def _tables_from_raw(self, raw_tables: list[tuple[int, int, list]]) -> Iterator[pd.DataFrame]:
+        """
+        Build, clean and filter DataFrames from raw (page_num, table_num, rows) tables.
+        
+        Tables continuing on the next page (same column count) reuse the previous
+        headers. Yields each table as soon as it is ready.
+        """
+        tables_found = 0
         last_headers = None  # Track headers for multi-page tables
+        last_header_signature = None  # Hashable header row, to spot headers repeated on each page
         last_num_cols = None
         
-        with pdfplumber.open(self.input_pdf) as pdf:
-            logger.info(f"PDF has {len(pdf.pages)} pages")
-            
-            for page_num, page in enumerate(pdf.pages, start=1):
-                logger.info(f"Processing page {page_num}/{len(pdf.pages)}")
+        for page_num, table_num, table in raw_tables:
+            if table and len(table) > 0:
+                # Check if first row looks like headers or data
+                first_row = table[0]
+                num_cols = len(first_row)
                 
-                # Extract tables from page
-                page_tables = page.extract_tables()
+                # Heuristic: If first row has similar column count and looks like continuation
+                is_continuation = False
+                if last_headers is not None and num_cols == last_num_cols:
+                    # Check if first row looks like data (not headers)
+                    # Data typically has numbers, dates, or varied content
+                    is_continuation = True
+                    logger.debug(f"  Detected continuation table on page {page_num}")
                 
-                if page_tables:
-                    for table_num, table in enumerate(page_tables, start=1):
-                        if table and len(table) > 0:
-                            # Check if first row looks like headers or data
-                            first_row = table[0]
-                            num_cols = len(first_row)
-                            
-                            # Heuristic: If first row has similar column count and looks like continuation
-                            is_continuation = False
-                            if last_headers is not None and num_cols == last_num_cols:
-                                # Check if first row looks like data (not headers)
-                                # Data typically has numbers, dates, or varied content
-                                is_continuation = True
-                                logger.debug(f"  Detected continuation table on page {page_num}")
-                            
-                            if is_continuation and last_headers is not None:
-                                # Use previous headers, all rows are data
-                                df = pd.DataFrame(table, columns=last_headers)
-                                logger.debug(f"  Using headers from previous page")
-                            else:
-                                # First row is headers
-                                df = pd.DataFrame(table[1:], columns=table[0])
-                                last_headers = table[0]  # Save headers for next page
-                                last_num_cols = num_cols
-                            
-                            # Clean up DataFrame
-                            df = self._clean_dataframe(df)
-                            
-                            # Reset index to avoid duplicate index issues
-                            df = df.reset_index(drop=True)
-                            
-                            # Validate it's a proper table
-                            if not self._is_valid_table(df, f"Page {page_num}"):
-                                continue
-                            
-                            # Filter for detail tables only if requested
-                            # Pass is_continuation flag to skip row count check for continuation pages
-                            if self.detail_only and not self._is_detail_table(df, f"Page {page_num}", is_continuation=is_continuation):
-                                continue
-                            
-                            # Add metadata
-                            df.attrs['page'] = page_num
-                            df.attrs['table_num'] = table_num
-                            
-                            tables.append(df)
-                            table_type = "DETAIL" if not self.detail_only else ""
-                            logger.info(
-                                f"  Found {table_type} table {table_num} on page {page_num}: "
-                                f"{len(df)} rows x {len(df.columns)} columns"
-                            )
-        
-        if not tables:
+                if is_continuation and last_headers is not None:
+                    # Use previous headers; optionally skip a header row the page repeats
+                    if self.drop_repeated_headers and tuple(first_row) == last_header_signature:
+                        df = _rows_to_dataframe(table[1:], last_headers)
+                        logger.debug(f"  Dropped repeated header row on page {page_num}")
+                    else:
+                        df = _rows_to_dataframe(table, last_headers)
+                    logger.debug(f"  Using headers from previous page")
+                else:
+                    # First row is headers
+                    df = _rows_to_dataframe(table[1:], table[0])
+                    last_headers = table[0]  # Save headers for next page
+                    last_header_signature = tuple(first_row)
+                    last_num_cols = num_cols
+                
+                # Clean up DataFrame
+                df = self._clean_dataframe(df)
+                
+                # Reset index to avoid duplicate index issues
+                df = df.reset_index(drop=True)
+                
+                # Validate it's a proper table
+                if not self._is_valid_table(df, f"Page {page_num}"):
+                    continue
+                
+                # Filter for detail tables only if requested
+                # Pass is_continuation flag to skip row count check for continuation pages
+                if self.detail_only and not self._is_detail_table(df, f"Page {page_num}", is_continuation=is_continuation):
+                    continue
+                
+                # Add metadata
+                df.attrs['page'] = page_num
+                df.attrs['table_num'] = table_num
+                
+                tables_found += 1
+                table_type = "DETAIL" if not self.detail_only else ""
+                logger.info(
+                    f"  Found {table_type} table {table_num} on page {page_num}: "
+                    f"{len(df)} rows x {len(df.columns)} columns"
+                )
+                yield df
+        
+        if not tables_found:
             logger.warning("No tables found in PDF")
+    
+    def _cache_path(self) -> Path:
+        """
+        Build the cache file path for the input PDF and extraction options.
         
-        return tables
+        Returns:
+            Path of the cache entry (content-addressed, so edited PDFs miss)
+        """
+        options = json.dumps(
+            {
+                'library': self.library,
+                'table_settings': self.table_settings,
+                'infer_numeric': self.infer_numeric,
+            },
+            sort_keys=True
+        )
+        key = hashlib.sha256(f"{_file_digest(self.input_pdf)}:{options}".encode()).hexdigest()
+        suffix = '.pkl.zst' if zstandard is not None else '.pkl'
+        return self.CACHE_DIR / f"{key}{suffix}"
     
-    def _extract_with_tabula(self) -> List[pd.DataFrame]:
+    def _load_or_extract(self, extract: Callable[[], T]) -> T:
+        """
+        Return cached extraction results for this PDF, or extract and cache them.
+        
+        Args:
+            extract: Callable performing the actual extraction
+        
+        Returns:
+            Extraction results (from cache when enabled and present)
+        """
+        if not self.use_cache:
+            return extract()
+        
+        cache_path = self._cache_path()
+        if cache_path.exists() and not self.force_refresh:
+            try:
+                data = cache_path.read_bytes()
+                if zstandard is not None:
+                    data = zstandard.ZstdDecompressor().decompress(data)
+                result = cast(T, pickle.loads(data))
+                logger.info(f"Loaded extraction results from cache: {cache_path}")
+                return result
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+        
+        result = extract()
+        
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        if zstandard is not None:
+            data = zstandard.ZstdCompressor(level=3).compress(data)
+        
+        # Write to a temp file and rename so readers never see a partial entry
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        temp_path.write_bytes(data)
+        temp_path.replace(cache_path)
+        logger.info(f"Cached extraction results: {cache_path}")
+        
+        return result
+    
+    def _extract_pages_in_parallel(
+        self, num_pages: int, extract_range: Callable[..., list[tuple[int, int, list]]], *args
+    ) -> list[tuple[int, int, list]]:
+        """
+        Extract raw tables with a process pool, one page range per worker.
+        
+        Args:
+            num_pages: Number of pages in the PDF
+            extract_range: Module-level worker taking (pdf_path, page_indices, *args)
+            *args: Extra worker arguments (e.g. table settings)
+        
+        Returns:
+            List of (page_num, table_num, raw_table) tuples in page order
+        """
+        page_ranges = _page_ranges(num_pages, self.workers)
+        logger.info(f"Extracting {num_pages} pages with {len(page_ranges)} worker processes")
+        
+        raw_tables = []
+        with _process_pool(len(page_ranges)) as executor:
+            futures = [
+                executor.submit(extract_range, str(self.input_pdf), page_indices, *args)
+                for page_indices in page_ranges
+            ]
+            for future in as_completed(futures):
+                raw_tables.extend(future.result())
+        
+        # Restore document order for the continuation-header logic
+        raw_tables.sort(key=lambda item: (item[0], item[1]))
+        return raw_tables
+    
+    def _count_pages(self) -> int | None:
+        """
+        Count the PDF's pages with pdfplumber, if it is installed.
+        
+        Returns:
+            Number of pages, or None when pdfplumber is unavailable
+        """
+        try:
+            import pdfplumber
+        except ImportError:
+            return None
+        
+        with pdfplumber.open(str(self.input_pdf)) as pdf:
+            return len(pdf.pages)
+    
+    def _read_page_shards(self, read_pages: Callable[[str, str], list[T]]) -> list[T]:
+        """
+        Run a tabula/camelot page reader over the PDF, sharded across worker processes.
+        
+        With one worker (or an unknown page count) the whole document is read in
+        this process. Otherwise each worker reads one contiguous page range, and
+        the results are concatenated in page order.
+        
+        Args:
+            read_pages: Module-level reader taking (pdf_path, pages)
+        
+        Returns:
+            Concatenated reader results in page order
+        """
+        pdf_path = str(self.input_pdf)
+        num_pages = self._count_pages() if self.workers > 1 else None
+        
+        if not num_pages or num_pages <= 1:
+            return read_pages(pdf_path, 'all')
+        
+        page_specs = [_page_spec(page_indices) for page_indices in _page_ranges(num_pages, self.workers)]
+        logger.info(f"Extracting {num_pages} pages with {len(page_specs)} worker processes")
+        
+        with _process_pool(len(page_specs)) as executor:
+            # map() yields in submission order, i.e. page order
+            shards = executor.map(read_pages, itertools.repeat(pdf_path), page_specs)
+            return list(itertools.chain.from_iterable(shards))
+    
+    def _extract_with_tabula(self) -> list[pd.DataFrame]:
         """Extract tables using tabula-py library."""
         try:
             import tabula
@@ -210,23 +845,7 @@ class PDFTableExtractor:
         logger.info("Extracting tables with tabula-py (this may take a moment)...")
         
         # Extract all tables from all pages
-        tables = tabula.read_pdf(
-            str(self.input_pdf),
-            pages='all',
-            multiple_tables=True,
-            lattice=True,  # Use lattice mode for tables with borders
-            stream=False   # Use stream mode for tables without borders if lattice fails
-        )
-        
-        if not tables:
-            logger.warning("No tables found. Trying stream mode...")
-            tables = tabula.read_pdf(
-                str(self.input_pdf),
-                pages='all',
-                multiple_tables=True,
-                lattice=False,
-                stream=True
-            )
+        tables = self._read_page_shards(_read_tabula_pages)
         
         # Clean tables
         cleaned_tables = []
@@ -239,7 +858,7 @@ class PDFTableExtractor:
         
         return cleaned_tables
     
-    def _extract_with_camelot(self) -> List[pd.DataFrame]:
+    def _extract_with_camelot(self) -> list[pd.DataFrame]:
         """Extract tables using camelot-py library."""
         try:
             import camelot
@@ -251,26 +870,11 @@ class PDFTableExtractor:
         
         logger.info("Extracting tables with camelot-py...")
         
-        # Try lattice mode first (for tables with borders)
-        tables = camelot.read_pdf(
-            str(self.input_pdf),
-            pages='all',
-            flavor='lattice'
-        )
-        
-        if len(tables) == 0:
-            logger.warning("No tables found with lattice mode. Trying stream mode...")
-            tables = camelot.read_pdf(
-                str(self.input_pdf),
-                pages='all',
-                flavor='stream'
-            )
+        tables = self._read_page_shards(_read_camelot_pages)
         
         # Convert to DataFrames
         dataframes = []
-        for idx, table in enumerate(tables, start=1):
-            df = table.df
-            
+        for idx, (page, accuracy, df) in enumerate(tables, start=1):
             # Use first row as header if it looks like headers
             if len(df) > 0:
                 df.columns = df.iloc[0]
@@ -278,19 +882,50 @@ class PDFTableExtractor:
                 df = df.reset_index(drop=True)
             
             df = self._clean_dataframe(df)
-            df.attrs['page'] = table.page
+            df.attrs['page'] = page
             df.attrs['table_num'] = idx
-            df.attrs['accuracy'] = table.accuracy
+            df.attrs['accuracy'] = accuracy
             
             dataframes.append(df)
             logger.info(
-                f"Found table {idx} on page {table.page}: "
+                f"Found table {idx} on page {page}: "
                 f"{len(df)} rows x {len(df.columns)} columns "
-                f"(accuracy: {table.accuracy:.2f}%)"
+                f"(accuracy: {accuracy:.2f}%)"
             )
         
         return dataframes
     
+    def _classify_tables(self, tables: list[pd.DataFrame]) -> list[pd.DataFrame]:
+        """
+        Keep only detail tables from a fully extracted list (tabula/camelot).
+        
+        Row counts are compared against min_detail_rows in one vectorized pass;
+        only the tables passing that cut get the full _is_detail_table checks.
+        Filtering after the cache keeps --include-summary/--min-detail-rows
+        changes effective on cached results.
+        
+        Args:
+            tables: Cleaned DataFrames in extraction order
+        
+        Returns:
+            Tables to keep (all of them unless detail_only)
+        """
+        if not self.detail_only or not tables:
+            return tables
+        
+        row_counts = np.fromiter((len(df) for df in tables), dtype=np.int64, count=len(tables))
+        candidates = np.flatnonzero(row_counts >= self.min_detail_rows)
+        logger.debug(f"  {len(tables) - len(candidates)} table(s) below {self.min_detail_rows} rows")
+        
+        detail_tables = []
+        for idx in candidates.tolist():
+            df = tables[idx]
+            if self._is_detail_table(df, f"Table {df.attrs.get('table_num', idx + 1)}"):
+                detail_tables.append(df)
+        
+        logger.info(f"Kept {len(detail_tables)} of {len(tables)} table(s) as DETAIL")
+        return detail_tables
+    
     def _is_detail_table(self, df: pd.DataFrame, debug_info: str = "", is_continuation: bool = False) -> bool:
         """
         Determine if table is detail data (vs summary data).
@@ -319,31 +954,45 @@ class PDFTableExtractor:
             logger.debug(f"  {debug_info} Identified as SUMMARY (only {len(df)} rows, need {self.min_detail_rows}+)")
             return False
         
-        # Check 2: Look for summary keywords in data
-        summary_keywords = ['total', 'summary', 'subtotal', 'grand total', 'sum', 'aggregate']
-        
-        # Convert all data to string and check for keywords
-        df_str = df.astype(str).values.flatten()
-        df_lower = [str(val).lower() for val in df_str]
-        
-        # Count how many cells contain summary keywords
-        keyword_matches = sum(1 for val in df_lower if any(keyword in val for keyword in summary_keywords))
-        
-        # If more than 20% of cells contain summary keywords, likely a summary table
-        total_cells = len(df_str)
-        if total_cells > 0 and (keyword_matches / total_cells) > 0.2:
-            logger.debug(f"  {debug_info} Identified as SUMMARY (contains summary keywords)")
-            return False
-        
-        # Check 3: Column count ratio (detail tables usually have more columns)
+        # Check 2: Column count ratio (detail tables usually have more columns)
         # If table has very few columns AND few rows, likely summary
+        # Shape-only, so it runs before the keyword scan materializes any strings
         if len(df.columns) <= 3 and len(df) < self.min_detail_rows * 2:
             logger.debug(f"  {debug_info} Identified as SUMMARY (only {len(df.columns)} columns and {len(df)} rows)")
             return False
         
+        # Check 3: Look for summary keywords in data
+        total_cells = df.size
+        if total_cells > 0:
+            # Count how many cells contain summary keywords
+            keyword_matches = self._count_keyword_cells(df)
+            
+            # If more than 20% of cells contain summary keywords, likely a summary table
+            if (keyword_matches / total_cells) > 0.2:
+                logger.debug(f"  {debug_info} Identified as SUMMARY (contains summary keywords)")
+                return False
+        
         logger.debug(f"  {debug_info} Identified as DETAIL ({len(df)} rows x {len(df.columns)} columns)")
         return True
     
+    def _count_keyword_cells(self, df: pd.DataFrame) -> int:
+        """
+        Count the cells of df that contain any summary keyword (case-insensitive).
+        
+        With pyarrow the flattened cells are matched in one RE2 pass over Arrow
+        strings; otherwise numpy's C-level char search runs once per keyword over
+        a lower-cased unicode array.
+        """
+        if pa is not None:
+            cells = pd.Series(df.to_numpy().ravel()).astype(_CELL_STRING_DTYPE)
+            return int(cells.str.contains(self.SUMMARY_KEYWORDS_PATTERN, case=False, regex=True, na=False).sum())
+        
+        flat_lower = np.char.lower(df.to_numpy(dtype=str).ravel())
+        mask = np.zeros(flat_lower.shape, dtype=bool)
+        for keyword in self.SUMMARY_KEYWORDS:
+            mask |= np.char.find(flat_lower, keyword) >= 0
+        return int(mask.sum())
+    
     def _is_valid_table(self, df: pd.DataFrame, debug_info: str = "") -> bool:
         """
         Check if DataFrame is a valid table (has headers and data).
@@ -371,8 +1020,8 @@ class PDFTableExtractor:
             logger.debug(f"  {debug_info} Skipped: All column names empty")
             return False
         
-        # Check if it has at least some data
-        has_data = not df.empty and df.notna().any().any()
+        # Check if it has at least some data (stops at the first column holding a value)
+        has_data = not df.empty and any(values.notna().any() for _, values in df.items())
         if not has_data:
             logger.debug(f"  {debug_info} Skipped: No data (all NaN)")
             return False
@@ -385,6 +1034,23 @@ class PDFTableExtractor:
         
         return True
     
+    @staticmethod
+    def _needs_strip(values: pd.Series) -> bool:
+        """
+        Check whether a string-like column has any leading/trailing whitespace.
+        
+        Args:
+            values: Column to check
+        
+        Returns:
+            True if any value needs stripping (or the column holds non-string values)
+        """
+        try:
+            return bool(values.str.contains(_EDGE_WHITESPACE_PATTERN, na=False).any())
+        except AttributeError:
+            # Object column without string values; let the string cast handle it
+            return True
+    
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Clean extracted DataFrame.
@@ -395,20 +1061,26 @@ class PDFTableExtractor:
         Returns:
             Cleaned DataFrame
         """
-        # Remove completely empty rows
-        df = df.dropna(how='all')
-        
-        # Remove completely empty columns
-        df = df.dropna(axis=1, how='all')
-        
-        # Strip whitespace from string columns
-        for col in df.columns:
-            try:
-                # Try to strip whitespace if column contains string-like data
-                df[col] = df[col].astype(str).str.strip()
-            except (AttributeError, TypeError):
-                # If column can't be converted to string, skip it
-                pass
+        # Remove completely empty rows and columns from a single NA scan
+        is_na = df.isna().to_numpy()
+        row_mask = ~np.all(is_na, axis=1)
+        col_mask = ~np.all(is_na, axis=0)
+        df = df.iloc[row_mask, col_mask]
+        
+        # Strip whitespace from string columns in one block-wise pass
+        # (addressed by position so duplicate headers work; numeric/datetime dtypes are kept)
+        # Columns without leading/trailing whitespace are skipped, avoiding the string copy
+        text_positions: list[int] = [
+            position
+            for position in np.flatnonzero(
+                df.dtypes.map(pd.api.types.is_string_dtype).to_numpy()
+            ).tolist()
+            if self._needs_strip(df.iloc[:, position])
+        ]
+        if len(text_positions) > 0:
+            df.iloc[:, text_positions] = (
+                df.iloc[:, text_positions].astype('string').apply(lambda values: values.str.strip())
+            )
         
         # Replace None/NaN with empty string for string columns
         df = df.fillna('')
@@ -416,9 +1088,61 @@ class PDFTableExtractor:
         # Reset index
         df = df.reset_index(drop=True)
         
+        # Store plain-number text columns as numbers (opt-in with infer_numeric)
+        if self.infer_numeric:
+            df = self._infer_dtypes(df)
+        
+        # Use Arrow-backed columns when pyarrow is available (columnar, faster IO)
+        if pa is not None:
+            df = df.convert_dtypes(dtype_backend='pyarrow')
+        
         return df
     
-    def _combine_tables(self, tables: List[pd.DataFrame]) -> pd.DataFrame:
+    @staticmethod
+    def _infer_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert text columns whose values are all plain numbers to numeric dtypes.
+        
+        A column is only converted when every non-empty value is a plain number
+        (no currency symbol, thousands separator, leading zero or trailing
+        decimal zero) of at most _MAX_NUMERIC_DIGITS digits, so the written number
+        reads back as the same text. Empty cells become missing values.
+        
+        Args:
+            df: Cleaned DataFrame
+        
+        Returns:
+            DataFrame with numeric-looking columns converted
+        """
+        text_positions: list[int] = np.flatnonzero(
+            df.dtypes.map(pd.api.types.is_string_dtype).to_numpy()
+        ).tolist()
+        
+        converted: dict[int, pd.Series] = {}
+        for position in text_positions:
+            values = df.iloc[:, position].astype(_CELL_STRING_DTYPE)
+            non_empty = values.notna() & (values != '')
+            if not non_empty.any():
+                continue
+            
+            present = values[non_empty]
+            if not (
+                present.str.fullmatch(_PLAIN_NUMBER_PATTERN).all()
+                and (present.str.count(r'\d') <= _MAX_NUMERIC_DIGITS).all()
+            ):
+                continue
+            
+            converted[position] = pd.to_numeric(values.where(non_empty))
+        
+        if not converted:
+            return df
+        
+        columns = [converted.get(position, df.iloc[:, position]) for position in range(df.shape[1])]
+        result = pd.concat(columns, axis=1, ignore_index=True)
+        result.columns = df.columns
+        return result
+    
+    def _combine_tables(self, tables: list[pd.DataFrame]) -> pd.DataFrame:
         """
         Combine multiple tables into one DataFrame.
         
@@ -448,228 +1172,458 @@ class PDFTableExtractor:
         if not non_empty_tables:
             raise ValueError("All tables are empty after cleaning")
         
-        # Get all unique columns across all tables
-        all_columns = []
-        for df in non_empty_tables:
-            all_columns.extend(df.columns.tolist())
-        unique_columns = list(dict.fromkeys(all_columns))  # Preserve order
-        
-        # Reindex all tables to have same columns
-        aligned_tables = []
-        for idx, df in enumerate(non_empty_tables, 1):
-            try:
-                # Create a copy to avoid modifying original
-                df_copy = df.copy()
-                
-                # Reset index to ensure uniqueness
-                df_copy = df_copy.reset_index(drop=True)
-                
-                # Add missing columns with empty values
-                for col in unique_columns:
-                    if col not in df_copy.columns:
-                        df_copy[col] = ''
-                
-                # Reorder columns to match
-                df_aligned = df_copy[unique_columns]
-                
-                # Ensure clean index for concatenation
-                df_aligned = df_aligned.reset_index(drop=True)
-                
-                aligned_tables.append(df_aligned)
-                
-                logger.debug(f"  Aligned table {idx}: {len(df_aligned)} rows x {len(df_aligned.columns)} columns")
-                
-            except Exception as e:
-                logger.error(f"  Error aligning table {idx}: {e}")
-                # Try to continue with other tables
-                continue
-        
-        if not aligned_tables:
-            raise ValueError("Failed to align any tables for concatenation")
+        # Fast path: every table already shares the same columns, no alignment needed
+        first_columns = non_empty_tables[0].columns
+        if all(df.columns.equals(first_columns) for df in non_empty_tables[1:]):
+            combined = pd.concat(non_empty_tables, ignore_index=True, sort=False)
+            logger.info(f"Combined table: {len(combined)} rows x {len(combined.columns)} columns")
+            return combined
         
-        # Concatenate all tables
+        # Concatenate with an outer join on columns: the union keeps first-seen
+        # column order (sort=False) and is built natively, without per-table copies
         try:
-            combined = pd.concat(aligned_tables, ignore_index=True, sort=False)
+            combined = pd.concat(non_empty_tables, ignore_index=True, sort=False, join='outer')
         except Exception as e:
-            logger.error(f"Error during concatenation: {e}")
-            logger.error("Attempting alternative concatenation method...")
-            
-            # Alternative: Convert all to string first
-            try:
-                string_tables = []
-                for df in aligned_tables:
-                    df_str = df.astype(str)
-                    string_tables.append(df_str)
-                combined = pd.concat(string_tables, ignore_index=True, sort=False)
-            except Exception as e2:
-                raise ValueError(f"Cannot concatenate tables: {e}. Alternative method also failed: {e2}")
+            raise ValueError(f"Cannot concatenate tables: {e}")
+        
+        # Columns missing from a table come back as NaN; match the cleaned tables' empty cells
+        # (numeric columns keep their dtype and stay NaN, which writers emit as blank cells)
+        text_columns = combined.dtypes.map(pd.api.types.is_string_dtype).to_numpy()
+        if text_columns.all():
+            combined = combined.fillna('')
+        elif text_columns.any():
+            text_positions = np.flatnonzero(text_columns)
+            combined.iloc[:, text_positions] = combined.iloc[:, text_positions].fillna('')
         
         logger.info(f"Combined table: {len(combined)} rows x {len(combined.columns)} columns")
         
         return combined
     
-    def _format_excel_sheet(self, worksheet, df: pd.DataFrame) -> None:
+    def _calculate_column_widths(self, df: pd.DataFrame) -> list[int]:
         """
-        Apply professional formatting to Excel worksheet.
+        Calculate auto-fit Excel column widths for a DataFrame.
         
         Args:
-            worksheet: openpyxl worksheet object
-            df: DataFrame that was written to the sheet
+            df: DataFrame that will be written to the sheet
+        
+        Returns:
+            List of column widths, one per column (between 10 and 50)
         """
-        # Define styles
-        header_font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
-        header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        # Header and longest-value lengths per column, computed column-wise in C
+        header_lengths = np.array([len(str(column)) for column in df.columns], dtype=np.int64)
+        if len(df) > 0:
+            data_lengths = df.astype(str).apply(lambda values: values.str.len().max()).to_numpy(dtype=np.int64)
+        else:
+            data_lengths = np.zeros(len(df.columns), dtype=np.int64)
         
-        data_font = Font(name='Calibri', size=10)
-        data_alignment = Alignment(horizontal='left', vertical='center')
+        # Set column width (with limits): min width of 10, max width of 50
+        widths = np.clip(np.maximum(header_lengths, data_lengths) + 2, 10, 50)
+        return cast(list[int], widths.tolist())
+    
+    @staticmethod
+    def _register_named_styles(workbook) -> None:
+        """
+        Register the header and data named styles with an openpyxl workbook.
         
-        border_style = Border(
-            left=Side(style='thin', color='D3D3D3'),
-            right=Side(style='thin', color='D3D3D3'),
-            top=Side(style='thin', color='D3D3D3'),
-            bottom=Side(style='thin', color='D3D3D3')
-        )
+        Args:
+            workbook: openpyxl Workbook to register the styles with
+        """
+        if _HEADER_STYLE_NAME not in workbook.named_styles:
+            workbook.add_named_style(NamedStyle(
+                name=_HEADER_STYLE_NAME,
+                font=_HEADER_FONT,
+                fill=_HEADER_FILL,
+                alignment=_HEADER_ALIGNMENT,
+                border=_CELL_BORDER
+            ))
+        if _DATA_STYLE_NAME not in workbook.named_styles:
+            workbook.add_named_style(NamedStyle(
+                name=_DATA_STYLE_NAME,
+                font=_DATA_FONT,
+                alignment=_DATA_ALIGNMENT,
+                border=_CELL_BORDER
+            ))
+    
+    @staticmethod
+    def _iter_excel_rows(df: pd.DataFrame) -> Iterator[tuple]:
+        """
+        Iterate DataFrame rows as tuples, with missing values (NaN/NA) as None.
+        
+        Excel writers reject pd.NA and write NaN as an error value, so missing
+        cells (e.g. blanks in numeric columns) must become empty cells.
         
-        # Format header row (row 1)
-        for col_num, column in enumerate(df.columns, 1):
-            cell = worksheet.cell(row=1, column=col_num)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = border_style
-        
-        # Format data rows
-        for row_num in range(2, len(df) + 2):
-            for col_num in range(1, len(df.columns) + 1):
-                cell = worksheet.cell(row=row_num, column=col_num)
-                cell.font = data_font
-                cell.alignment = data_alignment
-                cell.border = border_style
+        Args:
+            df: DataFrame to iterate
         
+        Returns:
+            Iterator of row tuples
+        """
+        if df.isna().to_numpy().any():
+            df = df.astype(object).where(df.notna(), None)
+        return df.itertuples(index=False, name=None)
+    
+    def _format_excel_sheet(self, worksheet, df: pd.DataFrame) -> None:
+        """
+        Apply sheet-level formatting (column widths, frozen header) to a worksheet.
+        
+        Write-only worksheets only accept these settings before the first row is
+        appended, so this must run before any data is written.
+        
+        Args:
+            worksheet: openpyxl worksheet object
+            df: DataFrame that will be written to the sheet
+        """
         # Auto-fit column widths
-        for col_num, column in enumerate(df.columns, 1):
-            column_letter = get_column_letter(col_num)
-            
-            # Calculate max length for column
-            max_length = len(str(column))  # Header length
-            for value in df[column].astype(str):
-                max_length = max(max_length, len(str(value)))
-            
-            # Set column width (with limits)
-            adjusted_width = min(max_length + 2, 50)  # Max width of 50
-            worksheet.column_dimensions[column_letter].width = max(adjusted_width, 10)  # Min width of 10
+        for col_num, width in enumerate(self._calculate_column_widths(df), 1):
+            worksheet.column_dimensions[get_column_letter(col_num)].width = width
         
         # Freeze header row
         worksheet.freeze_panes = 'A2'
+    
+    def _write_excel_sheet(self, workbook: Workbook, sheet_name: str, df: pd.DataFrame) -> None:
+        """
+        Stream a DataFrame into a new sheet of a write-only openpyxl workbook.
+        
+        Rows are appended as styled WriteOnlyCell objects, so the workbook never
+        holds the whole sheet's Cell tree in memory.
+        
+        Args:
+            workbook: Write-only openpyxl Workbook
+            sheet_name: Name of the sheet to create
+            df: DataFrame to write
+        """
+        # Register shared named styles once per workbook
+        self._register_named_styles(workbook)
+        
+        worksheet = workbook.create_sheet(sheet_name)
+        self._format_excel_sheet(worksheet, df)
+        
+        def styled_row(values, style_name: str) -> list:
+            cells = []
+            for value in values:
+                cell = WriteOnlyCell(worksheet, value=value)
+                cell.style = style_name
+                cells.append(cell)
+            return cells
+        
+        # Write header and data rows
+        worksheet.append(styled_row(df.columns, _HEADER_STYLE_NAME))
+        for row in self._iter_excel_rows(df):
+            worksheet.append(styled_row(row, _DATA_STYLE_NAME))
+        
+        logger.debug(f"  Wrote sheet {sheet_name}: {len(df)} rows x {len(df.columns)} columns")
+    
+    def _write_combined_with_xlsxwriter(self, xlsxwriter, df: pd.DataFrame) -> None:
+        """
+        Write the combined table with xlsxwriter row writes.
+        
+        Streams rows straight into the workbook (constant memory mode).
+        Formatting matches ``_write_excel_sheet``.
+        
+        Args:
+            xlsxwriter: Imported xlsxwriter module
+            df: Combined DataFrame to write
+        """
+        workbook = xlsxwriter.Workbook(
+            str(self.output_file),
+            {
+                'constant_memory': True,
+                'nan_inf_to_errors': True,
+                'strings_to_formulas': False,
+                'strings_to_urls': False,
+            }
+        )
+        try:
+            worksheet = workbook.add_worksheet('Combined_Data')
+            
+            # Define styles
+            header_format = workbook.add_format({
+                'font_name': 'Calibri', 'font_size': 11, 'bold': True, 'font_color': '#FFFFFF',
+                'bg_color': '#366092', 'align': 'center', 'valign': 'vcenter', 'text_wrap': True,
+                'border': 1, 'border_color': '#D3D3D3'
+            })
+            data_format = workbook.add_format({
+                'font_name': 'Calibri', 'font_size': 10, 'align': 'left', 'valign': 'vcenter',
+                'border': 1, 'border_color': '#D3D3D3'
+            })
+            
+            # Auto-fit column widths
+            for col_num, width in enumerate(self._calculate_column_widths(df)):
+                worksheet.set_column(col_num, col_num, width)
+            
+            # Write header and data rows
+            headers = ['' if col is None else str(col) for col in df.columns]
+            worksheet.write_row(0, 0, headers, header_format)
+            for row_num, row in enumerate(self._iter_excel_rows(df), start=1):
+                worksheet.write_row(row_num, 0, row, data_format)
+            
+            # Freeze header row
+            worksheet.freeze_panes(1, 0)
+        finally:
+            workbook.close()
         
-        logger.debug(f"  Applied formatting: {len(df)} rows x {len(df.columns)} columns")
+        logger.debug(f"  Wrote with xlsxwriter: {len(df)} rows x {len(df.columns)} columns")
     
-    def save_to_excel(self, tables: List[pd.DataFrame]) -> None:
+    def save_to_excel(self, tables: Iterable[pd.DataFrame]) -> int:
         """
         Save tables to Excel file.
         
         If combine_tables=True, all tables go into one sheet.
-        If combine_tables=False, each table gets its own sheet.
+        If combine_tables=False, each table gets its own sheet and is written as
+        soon as the iterable yields it.
         
         Args:
-            tables: List of DataFrames to save
+            tables: DataFrames to save (list or lazy iterator)
+        
+        Returns:
+            Number of tables saved
         
         Raises:
             ValueError: If no valid tables to save
         """
-        if not tables:
-            raise ValueError("No tables to save - all tables may have been filtered out")
-        
-        logger.info(f"Saving {len(tables)} table(s) to Excel: {self.output_file}")
-        
-        with pd.ExcelWriter(self.output_file, engine='openpyxl') as writer:
-            if self.combine_tables:
-                # Combine all tables into one
-                combined_df = self._combine_tables(tables)
-                
-                # Validate combined table is not empty
-                if combined_df.empty or len(combined_df.columns) == 0:
-                    raise ValueError("Combined table is empty - no valid data found")
+        if self.combine_tables:
+            tables = list(tables)
+            if not tables:
+                raise ValueError("No tables to save - all tables may have been filtered out")
+            
+            logger.info(f"Saving {len(tables)} table(s) to Excel: {self.output_file}")
+            
+            # Combine all tables into one
+            combined_df = self._combine_tables(tables)
+            
+            # Validate combined table is not empty
+            if combined_df.empty or len(combined_df.columns) == 0:
+                raise ValueError("Combined table is empty - no valid data found")
+            
+            # Prefer direct xlsxwriter row writes; fall back to openpyxl if not installed
+            try:
+                import xlsxwriter
+            except ImportError:
+                xlsxwriter = None
+            
+            if xlsxwriter is not None:
+                self._write_combined_with_xlsxwriter(xlsxwriter, combined_df)
+            else:
+                workbook = Workbook(write_only=True)
+                self._write_excel_sheet(workbook, 'Combined_Data', combined_df)
+                workbook.save(self.output_file)
+            
+            logger.info(f"  Saved combined table: {len(combined_df)} rows x {len(combined_df.columns)} columns")
+            tables_saved = len(tables)
+        else:
+            logger.info(f"Saving tables to Excel: {self.output_file}")
+            workbook = Workbook(write_only=True)
+            
+            # Save each table to separate sheet
+            sheets_saved = 0
+            for idx, df in enumerate(tables, start=1):
+                # Skip empty DataFrames
+                if df.empty or len(df.columns) == 0:
+                    logger.warning(f"  Skipped empty table {idx}")
+                    continue
                 
-                # Write data
-                combined_df.to_excel(writer, sheet_name='Combined_Data', index=False)
+                # Create sheet name
+                if 'page' in df.attrs:
+                    sheet_name = f"Page{df.attrs['page']}_Table{df.attrs.get('table_num', idx)}"
+                else:
+                    sheet_name = f"Table_{idx}"
                 
-                # Apply formatting
-                worksheet = writer.sheets['Combined_Data']
-                self._format_excel_sheet(worksheet, combined_df)
+                # Excel sheet names must be <= 31 characters
+                sheet_name = sheet_name[:31]
                 
-                logger.info(f"  Saved combined table: {len(combined_df)} rows x {len(combined_df.columns)} columns")
-            else:
-                # Save each table to separate sheet
-                sheets_saved = 0
-                for idx, df in enumerate(tables, start=1):
-                    # Skip empty DataFrames
-                    if df.empty or len(df.columns) == 0:
-                        logger.warning(f"  Skipped empty table {idx}")
-                        continue
-                    
-                    # Create sheet name
-                    if 'page' in df.attrs:
-                        sheet_name = f"Page{df.attrs['page']}_Table{df.attrs.get('table_num', idx)}"
-                    else:
-                        sheet_name = f"Table_{idx}"
-                    
-                    # Excel sheet names must be <= 31 characters
-                    sheet_name = sheet_name[:31]
-                    
-                    # Write to Excel
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    
-                    # Apply formatting
-                    worksheet = writer.sheets[sheet_name]
-                    self._format_excel_sheet(worksheet, df)
-                    
-                    logger.info(f"  Saved sheet: {sheet_name}")
-                    sheets_saved += 1
+                # Write to Excel
+                self._write_excel_sheet(workbook, sheet_name, df)
                 
-                if sheets_saved == 0:
-                    raise ValueError("No valid sheets saved - all tables were empty")
+                logger.info(f"  Saved sheet: {sheet_name}")
+                sheets_saved += 1
+            
+            if sheets_saved == 0:
+                raise ValueError("No valid sheets saved - all tables were empty")
+            
+            workbook.save(self.output_file)
+            tables_saved = sheets_saved
         
         logger.info(f"Successfully saved to: {self.output_file}")
+        return tables_saved
     
-    def save_to_csv(self, tables: List[pd.DataFrame]) -> None:
+    def _write_csv(self, df: pd.DataFrame, output_path: Path) -> None:
+        """
+        Write a DataFrame to CSV, using pyarrow's CSV writer when available.
+        
+        Args:
+            df: DataFrame to write
+            output_path: Destination CSV path
+        """
+        # pyarrow quotes every string value (and the header), so it is only used when
+        # no cell needs quoting and every column is text; the output then matches
+        # pandas' minimal quoting byte for byte. Anything else is written by pandas.
+        if (
+            pa_csv is None
+            or not df.columns.is_unique
+            or not all(pd.api.types.is_string_dtype(dtype) for dtype in df.dtypes)
+            or any(
+                df[col].astype(_CELL_STRING_DTYPE).str.contains(_CSV_QUOTE_PATTERN, regex=True).any()
+                for col in df.columns
+            )
+        ):
+            df.to_csv(output_path, index=False)
+            return
+        
+        df = df.rename(columns=lambda col: '' if col is None else str(col))
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with open(output_path, 'w', newline='') as header_file:
+            csv.writer(header_file, lineterminator='\n').writerow(df.columns)
+        with open(output_path, 'ab') as body_file:
+            pa_csv.write_csv(
+                table,
+                body_file,
+                pa_csv.WriteOptions(include_header=False, quoting_style='none')
+            )
+    
+    def _save_separate_files(
+        self, tables: Iterable[pd.DataFrame], extension: str, write: Callable[[pd.DataFrame, Path], None]
+    ) -> int:
+        """
+        Write one file per table, flushing every `flush_every` tables.
+        
+        Tables are pulled from the iterable in batches; each batch is written
+        concurrently and released before the next is extracted, so memory holds at
+        most one batch. A lone table is written to the output path itself.
+        
+        Args:
+            tables: DataFrames to save (list or lazy iterator)
+            extension: File extension for suffixed outputs (e.g. '.csv')
+            write: Writer taking (df, output_path)
+        
+        Returns:
+            Number of tables saved
+        """
+        table_iter = iter(tables)
+        
+        # Look ahead two tables: a single table keeps the requested filename
+        head = list(itertools.islice(table_iter, 2))
+        if len(head) == 1:
+            write(head[0], self.output_file)
+            logger.info(f"Saved to: {self.output_file}")
+            return 1
+        
+        table_iter = itertools.chain(head, table_iter)
+        base_name = self.output_file.stem
+        parent_dir = self.output_file.parent
+        
+        tables_saved = 0
+        with ThreadPoolExecutor(max_workers=self.OUTPUT_WRITER_THREADS) as executor:
+            while True:
+                batch = list(itertools.islice(table_iter, self.flush_every))
+                if not batch:
+                    break
+                
+                output_paths = [
+                    parent_dir / f"{base_name}_table_{idx}{extension}"
+                    for idx in range(tables_saved + 1, tables_saved + len(batch) + 1)
+                ]
+                
+                # Write the batch concurrently (Arrow writers release the GIL), then drop it
+                list(executor.map(write, batch, output_paths))
+                
+                for offset, output_path in enumerate(output_paths, start=1):
+                    logger.info(f"Saved table {tables_saved + offset} to: {output_path}")
+                tables_saved += len(batch)
+        
+        return tables_saved
+    
+    def save_to_csv(self, tables: Iterable[pd.DataFrame]) -> int:
         """
         Save tables to CSV file(s).
         
         If combine_tables=True, all tables saved to one CSV.
-        If combine_tables=False and multiple tables, creates separate files.
+        If combine_tables=False and multiple tables, creates separate files,
+        written in batches as the iterable yields them.
         
         Args:
-            tables: List of DataFrames to save
+            tables: DataFrames to save (list or lazy iterator)
+        
+        Returns:
+            Number of tables saved
         """
         if self.combine_tables:
             # Combine all tables into one CSV
+            tables = list(tables)
             combined_df = self._combine_tables(tables)
-            combined_df.to_csv(self.output_file, index=False)
+            self._write_csv(combined_df, self.output_file)
             logger.info(f"Saved combined table to: {self.output_file}")
             logger.info(f"  {len(combined_df)} rows x {len(combined_df.columns)} columns")
-        elif len(tables) == 1:
-            # Single table - save to specified filename
-            tables[0].to_csv(self.output_file, index=False)
-            logger.info(f"Saved to: {self.output_file}")
+            tables_saved = len(tables)
         else:
-            # Multiple tables - save with suffixes
-            base_name = self.output_file.stem
-            parent_dir = self.output_file.parent
-            
-            for idx, df in enumerate(tables, start=1):
-                output_path = parent_dir / f"{base_name}_table_{idx}.csv"
-                df.to_csv(output_path, index=False)
-                logger.info(f"Saved table {idx} to: {output_path}")
+            tables_saved = self._save_separate_files(tables, '.csv', self._write_csv)
         
-        logger.info(f"Successfully saved {len(tables)} table(s)")
+        logger.info(f"Successfully saved {tables_saved} table(s)")
+        return tables_saved
+    
+    def save_to_parquet(self, tables: Iterable[pd.DataFrame]) -> int:
+        """
+        Save tables to Parquet file(s).
+        
+        If combine_tables=True, all tables saved to one Parquet file.
+        If combine_tables=False and multiple tables, creates separate files,
+        written in batches as the iterable yields them.
+        
+        Args:
+            tables: DataFrames to save (list or lazy iterator)
+        
+        Returns:
+            Number of tables saved
+        
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "pyarrow not installed. Install with: pip install pyarrow"
+            )
+        
+        def to_arrow(df: pd.DataFrame):
+            # Parquet requires string column names
+            df = df.rename(columns=lambda col: '' if col is None else str(col))
+            return pa.Table.from_pandas(df, preserve_index=False)
+        
+        def write_parquet(df: pd.DataFrame, output_path: Path) -> None:
+            pq.write_table(
+                to_arrow(df),
+                output_path,
+                compression=self.PARQUET_COMPRESSION,
+                row_group_size=self.PARQUET_ROW_GROUP_SIZE,
+            )
+        
+        if self.combine_tables:
+            # Combine all tables into one Parquet file
+            tables = list(tables)
+            combined_df = self._combine_tables(tables)
+            write_parquet(combined_df, self.output_file)
+            logger.info(f"Saved combined table to: {self.output_file}")
+            logger.info(f"  {len(combined_df)} rows x {len(combined_df.columns)} columns")
+            tables_saved = len(tables)
+        else:
+            tables_saved = self._save_separate_files(tables, '.parquet', write_parquet)
+        
+        logger.info(f"Successfully saved {tables_saved} table(s)")
+        return tables_saved
     
     def process(self) -> None:
         """Main processing method: extract and save tables."""
         try:
+            # Separate sheets/files are written while extraction is still running
+            stream_tables = not self.combine_tables
+            
             # Extract tables
-            tables = self.extract_tables()
+            if stream_tables:
+                table_iter = self.iter_tables()
+                first_table = next(table_iter, None)
+                tables = [] if first_table is None else itertools.chain([first_table], table_iter)
+            else:
+                tables = self.extract_tables()
             
             if not tables:
                 logger.error("No valid tables found in PDF")
@@ -688,15 +1642,22 @@ class PDFTableExtractor:
                     logger.error("  - Try a different extraction library: --library tabula or --library camelot")
                 sys.exit(1)
             
-            logger.info(f"Total valid tables extracted: {len(tables)}")
+            # Only the non-streaming path has a list here; streamed tables are counted on save
+            if isinstance(tables, list):
+                logger.info(f"Total valid tables extracted: {len(tables)}")
             if self.detail_only:
                 logger.info(f"(Detail tables only, summaries filtered out)")
             
             # Save to output format
             if self.output_format == 'excel':
-                self.save_to_excel(tables)
+                tables_saved = self.save_to_excel(tables)
             elif self.output_format == 'csv':
-                self.save_to_csv(tables)
+                tables_saved = self.save_to_csv(tables)
+            elif self.output_format == 'parquet':
+                tables_saved = self.save_to_parquet(tables)
+            
+            if stream_tables:
+                logger.info(f"Total valid tables extracted: {tables_saved}")
             
             logger.info("Processing complete!")
             
@@ -715,10 +1676,22 @@ class PDFTableExtractor:
             raise
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+# Output format implied by the output file extension (overrides --format)
+_FORMAT_BY_SUFFIX = {
+    '.xlsx': 'excel',
+    '.xls': 'excel',
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+}
+
+# Default --num-workers: parsing is CPU-bound, but returns flatten beyond a few processes
+DEFAULT_WORKERS = min(os.cpu_count() or 1, 4)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments (from sys.argv when argv is None)."""
     parser = argparse.ArgumentParser(
-        description='Extract tables from PDF and convert to Excel or CSV',
+        description='Extract tables from PDF and convert to Excel, CSV or Parquet',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -728,11 +1701,23 @@ Examples:
   # Extract to CSV format
   python pdf_table_extractor.py --input report.pdf --output report.csv --format csv
   
+  # Extract to Parquet format (requires pyarrow)
+  python pdf_table_extractor.py --input report.pdf --output report.parquet --format parquet
+  
   # Use tabula library (good for complex layouts)
   python pdf_table_extractor.py --input report.pdf --output report.xlsx --library tabula
   
   # Use camelot library (best for bordered tables)
   python pdf_table_extractor.py --input report.pdf --output report.xlsx --library camelot
+  
+  # Read plain text-grid (borderless) reports straight from pdfminer.six
+  python pdf_table_extractor.py --input report.pdf --output report.xlsx --library fast-miner
+  
+  # Extract pages in parallel with 4 worker processes (any library)
+  python pdf_table_extractor.py --input report.pdf --output report.xlsx --num-workers 4
+  
+  # Extract in a single process
+  python pdf_table_extractor.py --input report.pdf --output report.xlsx --num-workers 1
         """
     )
     
@@ -747,22 +1732,22 @@ Examples:
         '--output',
         '-o',
         required=True,
-        help='Output file path (Excel or CSV)'
+        help='Output file path (Excel, CSV or Parquet)'
     )
     
     parser.add_argument(
         '--library',
         '-l',
         default='pdfplumber',
-        choices=['pdfplumber', 'tabula', 'camelot'],
-        help='PDF extraction library to use (default: pdfplumber)'
+        choices=['pdfplumber', 'tabula', 'camelot', 'fast-miner'],
+        help='PDF extraction library to use (default: pdfplumber; fast-miner: text-grid reports via pdfminer.six)'
     )
     
     parser.add_argument(
         '--format',
         '-f',
         default='excel',
-        choices=['excel', 'csv'],
+        choices=['excel', 'csv', 'parquet'],
         help='Output format (default: excel)'
     )
     
@@ -799,7 +1784,57 @@ Examples:
         help='Minimum rows to be considered detail data (default: 10)'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--num-workers',
+        '--workers',
+        '-w',
+        dest='workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Worker processes for page extraction (default: min(CPU count, 4) = {DEFAULT_WORKERS})'
+    )
+    
+    parser.add_argument(
+        '--table-settings',
+        type=json.loads,
+        default=None,
+        help='pdfplumber table settings as JSON, e.g. \'{"vertical_strategy": "text"}\' '
+             '(default: lines/lines strategies)'
+    )
+    
+    parser.add_argument(
+        '--drop-repeated-headers',
+        action='store_true',
+        help='Drop header rows repeated at the top of continuation pages (default: kept as data)'
+    )
+    
+    parser.add_argument(
+        '--infer-numeric',
+        action='store_true',
+        help='Write columns holding only plain numbers (up to 15 digits, no currency or '
+             'thousands formatting) as numbers (default: all columns are text)'
+    )
+    
+    parser.add_argument(
+        '--flush-every',
+        type=int,
+        default=50,
+        help='With --separate-tables, write CSV/Parquet files every N tables during extraction (default: 50)'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Cache extraction results keyed by PDF content (~/.cache/pdf_table_extractor)'
+    )
+    
+    parser.add_argument(
+        '--force-refresh',
+        action='store_true',
+        help='With --cache, re-extract and overwrite the cached entry for this PDF'
+    )
+    
+    return parser.parse_args(argv)
 
 
 def main():
@@ -807,11 +1842,7 @@ def main():
     args = parse_args()
     
     # Auto-detect format from output extension if not specified
-    output_ext = Path(args.output).suffix.lower()
-    if output_ext in ['.xlsx', '.xls']:
-        args.format = 'excel'
-    elif output_ext == '.csv':
-        args.format = 'csv'
+    args.format = _FORMAT_BY_SUFFIX.get(Path(args.output).suffix.lower(), args.format)
     
     # Determine if tables should be combined
     combine_tables = not args.separate_tables  # Default True unless --separate-tables specified
@@ -827,7 +1858,14 @@ def main():
         output_format=args.format,
         combine_tables=combine_tables,
         detail_only=detail_only,
-        min_detail_rows=args.min_detail_rows
+        min_detail_rows=args.min_detail_rows,
+        workers=args.workers,
+        use_cache=args.cache,
+        table_settings=args.table_settings,
+        infer_numeric=args.infer_numeric,
+        drop_repeated_headers=args.drop_repeated_headers,
+        force_refresh=args.force_refresh,
+        flush_every=args.flush_every
     )
     
     extractor.process()
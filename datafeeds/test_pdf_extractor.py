@@ -4,21 +4,28 @@ Run this before production deployment to verify functionality.
 """
 
 import sys
+import importlib.util
+import io
+import py_compile
 import subprocess
+from contextlib import redirect_stdout
 from pathlib import Path
 
-def run_test(test_name, command, expected_result):
-    """Run a single test case."""
+def run_test(test_name, args, expected_result):
+    """Run a single test case: a Python child process with the given arguments."""
+    # List form with the current interpreter: no shell, no PATH lookup, no word-splitting
+    command = [sys.executable, *args]
+    
     print(f"\n{'='*60}")
     print(f"TEST: {test_name}")
     print(f"{'='*60}")
-    print(f"Command: {command}")
+    print(f"Command: {subprocess.list2cmdline(command)}")
     print("-" * 60)
     
     try:
         result = subprocess.run(
             command,
-            shell=True,
+            shell=False,
             capture_output=True,
             text=True,
             timeout=60
@@ -42,6 +49,16 @@ def run_test(test_name, command, expected_result):
         return False
 
 
+def load_extractor_module(script_path):
+    """Import the extractor script in-process (no interpreter spawn)."""
+    spec = importlib.util.spec_from_file_location("pdf_table_extractor", script_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load extractor module from {script_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def main():
     """Run all tests."""
     print("\n" + "="*60)
@@ -99,33 +116,36 @@ def main():
     print("TEST 3: Checking Python Syntax")
     print("="*60)
     
-    result = subprocess.run(
-        "python -m py_compile datafeeds/pdf_table_extractor.py",
-        shell=True,
-        capture_output=True,
-        text=True
-    )
-    
-    if result.returncode == 0:
+    try:
+        py_compile.compile(str(script_path), doraise=True)
         print("[OK] Syntax check passed")
         tests_passed += 1
-    else:
-        print(f"[FAIL] Syntax error: {result.stderr}")
+    except py_compile.PyCompileError as e:
+        print(f"[FAIL] Syntax error: {e.msg}")
         tests_failed += 1
     
+    # Tests 4 and 5 call into the script directly
+    try:
+        extractor_module = load_extractor_module(script_path)
+    except Exception as e:
+        print(f"\n[FAIL] Could not import {script_path}: {e}")
+        extractor_module = None
+    
     # Test 4: Check help command
     print("\n" + "="*60)
     print("TEST 4: Checking Help Command")
     print("="*60)
     
-    result = subprocess.run(
-        "python datafeeds/pdf_table_extractor.py --help",
-        shell=True,
-        capture_output=True,
-        text=True
-    )
+    help_output = io.StringIO()
+    help_exit_code = None
+    if extractor_module is not None:
+        try:
+            with redirect_stdout(help_output):
+                extractor_module.parse_args(["--help"])
+        except SystemExit as e:
+            help_exit_code = e.code
     
-    if result.returncode == 0 and "usage:" in result.stdout.lower():
+    if help_exit_code == 0 and "usage:" in help_output.getvalue().lower():
         print("[OK] Help command works")
         print("  Arguments available: --input, --output, --library, etc.")
         tests_passed += 1
@@ -138,14 +158,14 @@ def main():
     print("TEST 5: Checking Error Handling")
     print("="*60)
     
-    result = subprocess.run(
-        "python datafeeds/pdf_table_extractor.py --input nonexistent.pdf --output test.xlsx",
-        shell=True,
-        capture_output=True,
-        text=True
-    )
+    error_message = ""
+    if extractor_module is not None:
+        try:
+            extractor_module.PDFTableExtractor(input_pdf="nonexistent.pdf", output_file="test.xlsx")
+        except FileNotFoundError as e:
+            error_message = str(e)
     
-    if result.returncode != 0 and "not found" in result.stderr.lower():
+    if "not found" in error_message.lower():
         print("[OK] Error handling works (proper error message for missing file)")
         tests_passed += 1
     else:
@@ -1,40 +1,31 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class ApplicationEnvironment(Enum):
+class ApplicationEnvironment(StrEnum):
     """Enum for application environment."""
 
     DEV = "DEV"
     TEST = "TEST"
     PROD = "PROD"
 
-    def __str__(self) -> str:
-        return self.value
 
-
-class DatamartFrameworkTable(Enum):
+class DatamartFrameworkTable(StrEnum):
     """Enum for ETL framework tables."""
 
     CONTROL_TABLE = "CONTROL_TABLE"
     EXECUTION_TABLE = "EXECUTION_TABLE"
     MERGE_EXECUTION_LOG_TABLE = "MERGE_EXECUTION_LOG_TABLE"
 
-    def __str__(self) -> str:
-        return self.value
-
 
-class SnowparkTableType(Enum):
+class SnowparkTableType(StrEnum):
     """Enum for Snowpark table types."""
 
     TEMPORARY = "temporary"
     TRANSIENT = "transient"
     PERMANENT = "permanent"
 
-    def __str__(self) -> str:
-        return self.value
-
 
-class SnowparkTableWriteMode(Enum):
+class SnowparkTableWriteMode(StrEnum):
     """Enum for Snowpark table write modes."""
 
     APPEND = "append"
@@ -43,11 +34,8 @@ class SnowparkTableWriteMode(Enum):
     ERROR_IF_EXISTS = "error_if_exists"
     IGNORE = "ignore"
 
-    def __str__(self) -> str:
-        return self.value
 
-
-class ExecutionStatus(Enum):
+class ExecutionStatus(StrEnum):
     """Enum for execution status."""
 
     STARTING = "STARTING"
@@ -55,28 +43,22 @@ class ExecutionStatus(Enum):
     FAIL = "FAIL"
     IN_PROGRESS = "IN_PROGRESS"
 
-    def __str__(self) -> str:
-        return self.value
-
 
-class UpsertResultStatus(Enum):
+class UpsertResultStatus(StrEnum):
     """Enum for upsert result status."""
 
     SUCCESS = "SUCCESS"
     FAIL = "FAIL"
 
-    def __str__(self) -> str:
-        return self.value
-
 
-class TestCaseType(str, Enum):
+class TestCaseType(StrEnum):
     """Enum for test case types."""
 
     DATA_TESTING = "DATA_TESTING"
     SINGULAR_DATA_TESTING = "SINGULAR_DATA_TESTING"
 
 
-class SnowflakeAuthenticatorType(str, Enum):
+class SnowflakeAuthenticatorType(StrEnum):
     """Enum for Snowflake authenticator type."""
 
     EXTERNALBROWSER = "EXTERNALBROWSER"
@@ -1,9 +1,13 @@
+import functools
 import os
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 from datamart_analytics.definitions.custom_definitions import SnowflakeAuthenticatorType
 from datamart_analytics.operations.obfuscation_operations import decode_string
 
+# Resolved once at import: the first dotenv file present in the working directory, if any
+_ENV_FILE = next((path for path in (".env", ".env.example") if os.path.isfile(path)), None)
+
 
 class EnvironmentConfiguration(BaseSettings):
     """
@@ -92,10 +96,30 @@ class EnvironmentConfiguration(BaseSettings):
         Configuration for Pydantic settings.
         """
 
-        env_file = (
-            ".env" if os.path.exists(".env") else ".env.example" if os.path.exists(".env.example") else None
-        )
+        env_file = _ENV_FILE
         env_file_encoding = "utf-8"
 
 
-environment_configuration = EnvironmentConfiguration()
+@functools.lru_cache(maxsize=None)
+def get_env() -> EnvironmentConfiguration:
+    """
+    Return the environment configuration, loading it on first use.
+
+    Importing this module (e.g. for its types) no longer reads the dotenv file or
+    decodes secrets; that happens once, on the first call.
+
+    Returns:
+        EnvironmentConfiguration: The shared configuration instance.
+    """
+    return EnvironmentConfiguration()
+
+
+# Descriptive alias sharing get_env's cache
+get_environment_configuration = get_env
+
+
+def __getattr__(name: str) -> EnvironmentConfiguration:
+    """Keep `from datamart_analytics.environment import environment_configuration` working."""
+    if name == "environment_configuration":
+        return get_env()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,29 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def _queue_handler(*handlers: logging.Handler) -> QueueHandler:
+    """
+    Route records through a queue to the given handlers on a background thread.
+
+    Log calls only enqueue the record; a QueueListener thread does the console
+    and file I/O. The listener is stopped (and the queue drained) at exit.
+
+    Args:
+        *handlers (logging.Handler): Handlers that perform the actual output.
+
+    Returns:
+        QueueHandler: Handler to attach to the logger in place of `handlers`.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return QueueHandler(log_queue)
 
 
 def main_logger() -> logging.Logger:
@@ -29,8 +52,7 @@ def main_logger() -> logging.Logger:
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
 
-        logger.addHandler(file_handler)
-        logger.addHandler(console_logger)
+        logger.addHandler(_queue_handler(file_handler, console_logger))
 
     return logger
 
@@ -55,7 +77,7 @@ def debug_logger() -> logging.Logger:
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
 
-        logger.addHandler(file_handler)
+        logger.addHandler(_queue_handler(file_handler))
 
     return logger
 
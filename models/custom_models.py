@@ -1,5 +1,5 @@
 from uuid import uuid4
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datamart_analytics.definitions.custom_definitions import (
     SnowflakeAuthenticatorType,
     UpsertResultStatus,
@@ -268,6 +268,8 @@ class TableConfiguration(BaseModel):
     Configuration class for a table.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Name of the Table")
     source_table_name: str | None = Field(
         default=None, description="Source table name for the Table"
@@ -295,6 +297,8 @@ class DatamartConfiguration(BaseModel):
     Configuration class for DataMart.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     tables: list[TableConfiguration] = Field(
         default_factory=list, description="List of DataMart table configurations"
     )
@@ -1,11 +1,44 @@
+from string import Template
 from datamart_analytics.connector.snowpark_connector import SnowparkConnector
 from datamart_analytics.logger import logger
 from datamart_analytics.models.custom_models import DatamartTable_integrated
+from datamart_analytics.operations.snowflake_query_operations import (
+    list_existing_tables,
+)
+
+# DDL templates: only the identifiers vary, so the SQL text is identical across runs
+_EXECUTION_LOG_DDL = Template("""
+CREATE TABLE IF NOT EXISTS $database.$schema.$table_name (
+    ID STRING(255) NOT NULL PRIMARY KEY,
+    CARRIER_NAME STRING(255) NOT NULL,
+    DATABASE_NAME STRING(255) NOT NULL,
+    FOLDER_NAME STRING(255) NOT NULL,
+    --SCHEMA_NAME STRING(255) NOT NULL,
+    TABLE_OR_SCRIPT_NAME STRING(255) NOT NULL,
+    INSERTED_ROW_COUNT NUMBER DEFAULT 0,
+    UPDATED_ROW_COUNT NUMBER DEFAULT 0,
+    START_TIMESTAMP STRING NOT NULL,
+    END_TIMESTAMP STRING NOT NULL,
+    QUERY_DURATION STRING,
+    GENERAL_ERROR_MESSAGE STRING,
+    STATUS STRING
+)
+""")
+
+_EXECUTION_METADATA_DDL = Template("""
+CREATE TABLE IF NOT EXISTS $database.$schema.$table_name (
+    PROCESS_NAME VARCHAR(255) NOT NULL,
+    CARRIER_NAME VARCHAR(255) NOT NULL,
+    LAST_LOAD_TIMESTAMP TIMESTAMP NOT NULL
+)
+""")
 
 
 def create_execution_log_table(
     snowpark_connector: SnowparkConnector,
     datamart_table: DatamartTable_integrated,
+    existing_tables: set[str] | None = None,
+    verify: bool = False,
 ) -> None:
     """
     Create execution log and control tables in the target Snowflake database.
@@ -17,6 +50,13 @@ def create_execution_log_table(
             The Snowpark connector object for connecting to the target Snowflake environment.
         datamart_table: DatamartTable_integrated
             The datamart table configuration containing target database and schema information.
+        existing_tables: set[str] | None
+            Tables already in the target schema, from list_existing_tables. Pass the same set
+            to both create functions to check them with one query.
+        verify: bool
+            If True and existing_tables is omitted, list the schema's tables first so an
+            existing table is logged and skipped. By default only the idempotent
+            CREATE TABLE IF NOT EXISTS is sent.
     Returns:
         None
     """
@@ -24,32 +64,22 @@ def create_execution_log_table(
         # Define table names
         execution_table_name = "DATAMART_EXECUTION_LOG_TABLE"
 
-        # Check if the execution table exists
-        execution_table_exists = snowpark_connector.execute_query(
-            query=f"SHOW TABLES LIKE '{execution_table_name}' IN SCHEMA {datamart_table.target_schema}",
-            lazy=False,
-        )
+        # Check if the execution table exists (opt-in: the DDL is a no-op for existing tables)
+        if existing_tables is None and verify:
+            existing_tables = list_existing_tables(
+                snowpark_connector,
+                datamart_table.target_database,
+                datamart_table.target_schema,
+            )
 
         # Define the table creation SQL for DATAMART_EXECUTION_LOG_TABLE
-        execution_table_sql = f"""
-        CREATE TABLE IF NOT EXISTS {datamart_table.target_database}.{datamart_table.target_schema}.{execution_table_name} (
-            ID STRING(255) NOT NULL PRIMARY KEY,
-            CARRIER_NAME STRING(255) NOT NULL,
-            DATABASE_NAME STRING(255) NOT NULL,
-            FOLDER_NAME STRING(255) NOT NULL,
-            --SCHEMA_NAME STRING(255) NOT NULL,
-            TABLE_OR_SCRIPT_NAME STRING(255) NOT NULL,
-            INSERTED_ROW_COUNT NUMBER DEFAULT 0,
-            UPDATED_ROW_COUNT NUMBER DEFAULT 0,
-            START_TIMESTAMP STRING NOT NULL,
-            END_TIMESTAMP STRING NOT NULL,
-            QUERY_DURATION STRING,
-            GENERAL_ERROR_MESSAGE STRING,
-            STATUS STRING
+        execution_table_sql = _EXECUTION_LOG_DDL.substitute(
+            database=datamart_table.target_database,
+            schema=datamart_table.target_schema,
+            table_name=execution_table_name,
         )
-        """
 
-        if execution_table_exists and len(execution_table_exists) > 0:
+        if existing_tables is not None and execution_table_name in existing_tables:
             logger.info(
                 f"Table '{execution_table_name}' already exists in schema '{datamart_table.target_schema}'"
             )
@@ -59,7 +89,7 @@ def create_execution_log_table(
                 execution_table_sql, lazy=False
             )
             logger.info(
-                f"Execution log table '{execution_table_name}' created successfully in schema '{datamart_table.target_schema}'"
+                f"Execution log table '{execution_table_name}' is present in schema '{datamart_table.target_schema}'"
             )
 
     except Exception as e:
@@ -70,6 +100,8 @@ def create_execution_log_table(
 def create_execution_metadata_table(
     snowpark_connector: SnowparkConnector,
     datamart_table: DatamartTable_integrated,
+    existing_tables: set[str] | None = None,
+    verify: bool = False,
 ) -> None:
     """
     Ensures that the required DATAMART_EXECUTION_METADATA_TABLE table is created in the target database and schema if it does not already exist.
@@ -79,6 +111,12 @@ def create_execution_metadata_table(
             The Snowpark connector object for connecting to the target Snowflake environment.
         datamart_table: DatamartTable_integrated
             The datamart table configuration containing target database and schema information.
+        existing_tables: set[str] | None
+            Tables already in the target schema, from list_existing_tables.
+        verify: bool
+            If True and existing_tables is omitted, list the schema's tables first so an
+            existing table is logged and skipped. By default only the idempotent
+            CREATE TABLE IF NOT EXISTS is sent.
     Returns:
         None
     """
@@ -86,28 +124,28 @@ def create_execution_metadata_table(
         # Define table name
         metadata_table_name = "DATAMART_EXECUTION_METADATA_TABLE"
 
-        # Check if the table exists
-        metadata_table_exists = snowpark_connector.execute_query(
-            query=f"SHOW TABLES LIKE '{metadata_table_name}' IN SCHEMA {datamart_table.target_schema}",
-            lazy=False,
-        )
+        # Check if the table exists (opt-in: the DDL is a no-op for existing tables)
+        if existing_tables is None and verify:
+            existing_tables = list_existing_tables(
+                snowpark_connector,
+                datamart_table.target_database,
+                datamart_table.target_schema,
+            )
 
-        if metadata_table_exists and len(metadata_table_exists) > 0:
+        if existing_tables is not None and metadata_table_name in existing_tables:
             logger.info(
                 f"Table '{metadata_table_name}' already exists in schema '{datamart_table.target_schema}'"
             )
         else:
             # Define the table creation SQL
-            metadata_table_sql = f"""
-            CREATE TABLE IF NOT EXISTS {datamart_table.target_database}.{datamart_table.target_schema}.{metadata_table_name} (
-                PROCESS_NAME VARCHAR(255) NOT NULL,
-                CARRIER_NAME VARCHAR(255) NOT NULL,
-                LAST_LOAD_TIMESTAMP TIMESTAMP NOT NULL
+            metadata_table_sql = _EXECUTION_METADATA_DDL.substitute(
+                database=datamart_table.target_database,
+                schema=datamart_table.target_schema,
+                table_name=metadata_table_name,
             )
-            """
             snowpark_connector.execute_query(metadata_table_sql, lazy=False)
             logger.info(
-                f"Table '{metadata_table_name}' created successfully in schema '{datamart_table.target_schema}'"
+                f"Table '{metadata_table_name}' is present in schema '{datamart_table.target_schema}'"
             )
 
     except Exception as e:
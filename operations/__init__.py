@@ -13,6 +13,7 @@ Functions:
     
     Snowflake Query Operations:
         - create_execution_log_table: Create execution log tables in Snowflake
+        - list_existing_tables: List the tables in a schema in one query
 """
 
 from datamart_analytics.operations.obfuscation_operations import (
@@ -22,6 +23,7 @@ from datamart_analytics.operations.obfuscation_operations import (
 )
 from datamart_analytics.operations.snowflake_query_operations import (
     create_execution_log_table,
+    list_existing_tables,
 )
 
 __all__ = [
@@ -29,4 +31,5 @@ __all__ = [
     "decode_string",
     "load_snowflake_private_key",
     "create_execution_log_table",
+    "list_existing_tables",
 ]
@@ -1,4 +1,6 @@
 import base64
+import functools
+import os
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
@@ -7,6 +9,9 @@ from datamart_analytics.custom_exceptions.snowflake_exceptions import (
 )
 from datamart_analytics.logger import logger
 
+# Resolved once; the backend is a process-wide singleton
+_CRYPTO_BACKEND = default_backend()
+
 
 def encode_string(value: str) -> str:
     """
@@ -21,9 +26,11 @@ def encode_string(value: str) -> str:
     return base64.b64encode(value.encode()).decode()
 
 
+@functools.lru_cache(maxsize=128)
 def decode_string(value: str) -> str:
     """
     Decodes a Base64 encoded string back to its original representation.
+    Results are cached, as the same secrets are decoded on every settings load.
 
     Params:
         value (str): The Base64 encoded string to decode.
@@ -31,7 +38,8 @@ def decode_string(value: str) -> str:
     Returns:
         str: The original string representation.
     """
-    return base64.b64decode(value.encode()).decode()
+    # b64decode accepts ASCII str directly; no intermediate bytes object
+    return base64.b64decode(value, validate=False).decode("utf-8")
 
 
 def load_snowflake_private_key(
@@ -39,6 +47,8 @@ def load_snowflake_private_key(
 ) -> bytes:
     """
     Loads and decodes the Snowflake private key from an environment variable.
+    The parsed key is cached per file (and modification time) and password, so
+    repeated session bootstraps skip the PEM parse.
 
     Params:
         snowflake_secret_key_file (str): Path to the private key file.
@@ -52,6 +62,39 @@ def load_snowflake_private_key(
             "Both private key file path and password must be provided."
         )
 
+    try:
+        modified_ns = os.stat(snowflake_secret_key_file).st_mtime_ns
+    except FileNotFoundError:
+        logger.error(f"Private key file not found: {snowflake_secret_key_file}")
+        raise SnowflakePrivateKeyException(
+            f"Private key file not found: {snowflake_secret_key_file}"
+        )
+    except Exception as e:
+        logger.error(f"Error reading private key file: {e}")
+        raise SnowflakePrivateKeyException(f"Error reading private key file: {e}")
+
+    return _load_private_key_der(
+        snowflake_secret_key_file, modified_ns, snowflake_private_key_password
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_private_key_der(
+    snowflake_secret_key_file: str,
+    modified_ns: int,
+    snowflake_private_key_password: str,
+) -> bytes:
+    """
+    Reads and parses a PEM private key into unencrypted PKCS8 DER bytes.
+
+    Params:
+        snowflake_secret_key_file (str): Path to the private key file.
+        modified_ns (int): File modification time, so an edited key file misses the cache.
+        snowflake_private_key_password (str): Password for the private key.
+
+    Returns:
+        bytes: The decoded private key in bytes.
+    """
     try:
         with open(snowflake_secret_key_file, "rb") as key_file:
             private_key_file = key_file.read()
@@ -68,7 +111,7 @@ def load_snowflake_private_key(
         private_key: PrivateKeyTypes = serialization.load_pem_private_key(
             data=private_key_file,
             password=snowflake_private_key_password.encode(),
-            backend=default_backend(),
+            backend=_CRYPTO_BACKEND,
         )
 
         private_key_bytes: bytes = private_key.private_bytes(
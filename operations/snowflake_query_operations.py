@@ -1,10 +1,83 @@
+from __future__ import annotations
+
+import re
+from string import Template
+from typing import TYPE_CHECKING
 from snowflake.snowpark.session import Session
-from datamart_analytics.connector.snowpark_connector import SnowparkConnector
 from datamart_analytics.definitions.custom_definitions import (
     DatamartFrameworkTable,
 )
 from datamart_analytics.logger import logger
 
+if TYPE_CHECKING:
+    # Annotation-only: a runtime import closes the cycle
+    # environment -> operations -> connector.snowpark_connector -> environment
+    from datamart_analytics.connector.snowpark_connector import SnowparkConnector
+
+# Unquoted Snowflake identifier; the database name is formatted into the listing probe
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_$]*")
+
+# Table listing probe; only the identifiers vary, so the SQL text is identical across runs
+_LIST_TABLES_QUERY = Template(
+    "SELECT TABLE_NAME FROM $database.INFORMATION_SCHEMA.TABLES "
+    "WHERE TABLE_SCHEMA = UPPER('$schema')"
+)
+
+# Static body of the execution log DDL; only the fully-qualified name varies
+_EXECUTION_LOG_DDL = Template(
+    """
+CREATE TABLE IF NOT EXISTS $database.$schema.$table (
+    ID NUMBER AUTOINCREMENT PRIMARY KEY,
+    TABLE_NAME STRING NOT NULL,
+    MERGE_STATUS STRING NOT NULL,
+    ROWS_INSERTED NUMBER,
+    ROWS_UPDATED NUMBER,
+    ROWS_DELETED NUMBER,
+    EXECUTION_TIMESTAMP TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+)
+
+# (account, database, schema) keys whose execution log table this process already created
+_created_execution_log_tables: set[tuple[str, str, str]] = set()
+
+
+def list_existing_tables(
+    snowpark_connector: SnowparkConnector,
+    database: str,
+    schema: str,
+) -> set[str]:
+    """
+    List the tables in a Snowflake schema with a single INFORMATION_SCHEMA query.
+    Callers checking several tables should fetch this set once and test membership,
+    instead of issuing one SHOW TABLES round-trip per table.
+
+    Parameters:
+        snowpark_connector: SnowparkConnector
+            The Snowpark connector object with an open session.
+        database: str
+            The name of the database in Snowflake.
+        schema: str
+            The name of the schema in Snowflake.
+    Returns:
+        set[str]: Upper-case names of the tables in the schema.
+    Raises:
+        ValueError: If the database name is not a plain identifier.
+    """
+    if not _IDENTIFIER_RE.fullmatch(database):
+        raise ValueError(f"Invalid database name: {database!r}")
+
+    rows = snowpark_connector.execute_query(
+        # The schema is a string literal in the query; double any quote it contains
+        query=_LIST_TABLES_QUERY.substitute(
+            database=database, schema=schema.replace("'", "''")
+        ),
+        lazy=False,
+    )
+    if not isinstance(rows, list):
+        return set()
+    return {row[0].upper() for row in rows}
+
 
 def create_execution_log_table(
     snowpark_connector_target: SnowparkConnector,
@@ -15,6 +88,7 @@ def create_execution_log_table(
     Create execution log and control tables in the target Snowflake database.
     This function ensures that the required execution log and control tables are created
     in the target database and schema if they do not already exist.
+    Repeat calls for the same account, database and schema within a process are skipped.
 
     Parameters:
         snowpark_connector_target: SnowparkConnector
@@ -26,41 +100,38 @@ def create_execution_log_table(
     Returns:
         None
     """
+    created_key = (
+        snowpark_connector_target.snowflake_credentials.account,
+        target_database,
+        target_schema,
+    )
+    if created_key in _created_execution_log_tables:
+        return
+
     try:
         with snowpark_connector_target as connector:
             target_session: Session = connector.session
 
-            # Set the database and schema context
-            logger.info(
-                f"Using target database: {target_database}, schema: {target_schema}"
-            )
-            target_session.use_database(target_database)
-            target_session.use_schema(target_schema)
-
-            # Define the table creation SQL for execution log table
             execution_log_table_name = (
                 DatamartFrameworkTable.MERGE_EXECUTION_LOG_TABLE.value
             )
-            execution_log_table_sql = f"""
-            CREATE TABLE IF NOT EXISTS {target_database}.{target_schema}.{execution_log_table_name} (
-                ID NUMBER AUTOINCREMENT PRIMARY KEY,
-                TABLE_NAME STRING NOT NULL,
-                MERGE_STATUS STRING NOT NULL,
-                ROWS_INSERTED NUMBER,
-                ROWS_UPDATED NUMBER,
-                ROWS_DELETED NUMBER,
-                EXECUTION_TIMESTAMP TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            execution_log_table_sql = _EXECUTION_LOG_DDL.substitute(
+                database=target_database,
+                schema=target_schema,
+                table=execution_log_table_name,
             )
-            """
-            # Execute the SQL to create the execution log table
+            # The DDL is fully qualified, so no USE DATABASE / USE SCHEMA round-trips
             logger.info(
                 f"Creating execution log table: {execution_log_table_name}"
             )
             target_session.sql(execution_log_table_sql).collect()
+            _created_execution_log_tables.add(created_key)
             logger.info(
                 f"Execution log table '{execution_log_table_name}' created successfully."
             )
     except Exception as e:
+        # Let the next call retry the DDL
+        _created_execution_log_tables.discard(created_key)
         logger.error(
             f"Failed to create execution or control tables in Snowflake. Error: {e}"
         )
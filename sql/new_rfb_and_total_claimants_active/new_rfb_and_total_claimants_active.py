@@ -1,4 +1,5 @@
-from datetime import datetime
+import time
+from snowflake.snowpark import DataFrame
 from datamart_analytics.models.custom_models import DatamartTable
 from datamart_analytics.connector.snowpark_connector import SnowparkConnector
 from datamart_analytics.logger import logger
@@ -8,7 +9,11 @@ from datamart_analytics.tools.datamart_utils import (
 )
 
 
-def run_new_rfb_and_total_claimants_active(datamart_table: DatamartTable):
+def run_new_rfb_and_total_claimants_active(
+    datamart_table: DatamartTable,
+    detail_columns: list[str] | None = None,
+    summary_columns: list[str] | None = None,
+):
     """
     Run the new_rfb_and_total_claimants_active report.
     
@@ -19,11 +24,14 @@ def run_new_rfb_and_total_claimants_active(datamart_table: DatamartTable):
     
     Args:
         datamart_table: DatamartTable configuration with required parameters
+        detail_columns: Optional subset of detail columns to keep; the projection is
+            folded into the lazy plan so unused columns are never scanned or written
+        summary_columns: Optional subset of summary columns to keep
     
     Raises:
         Exception: If report execution fails
     """
-    execution_start = datetime.now()
+    execution_start = time.perf_counter()
 
     try:
         snowflake_credentials = create_target_credentials(datamart_table)
@@ -44,7 +52,8 @@ def run_new_rfb_and_total_claimants_active(datamart_table: DatamartTable):
             connector.save_as_view(service_view_df, "service_type_by_vendor")
             logger.info("Successfully created service_type_by_vendor view")
 
-            # Step 2: Create detail table
+            # Steps 2 and 3 both read the view but not each other, so they are
+            # submitted together and run concurrently on the warehouse
             logger.info("Step 2/3: Creating detail table...")
             detail_df = connector.execute_query_from_file(
                 file_name="new_rfb_and_total_claimants_active_detail.sql",
@@ -52,10 +61,14 @@ def run_new_rfb_and_total_claimants_active(datamart_table: DatamartTable):
                 lazy=True,
                 folder_name="new_rfb_and_total_claimants_active",
             )
-            connector.save_as_table(detail_df, "new_rfb_and_total_claimants_active_detail")
-            logger.info("Successfully created new_rfb_and_total_claimants_active_detail table")
+            # lazy=True returns the DataFrame itself
+            assert isinstance(detail_df, DataFrame)
+            if detail_columns:
+                detail_df = detail_df.select(detail_columns)
+            detail_job = connector.save_as_table(
+                detail_df, "new_rfb_and_total_claimants_active_detail", block=False
+            )
 
-            # Step 3: Create summary table
             logger.info("Step 3/3: Creating summary table...")
             summary_df = connector.execute_query_from_file(
                 file_name="new_rfb_and_total_claimants_active_summary.sql",
@@ -63,19 +76,28 @@ def run_new_rfb_and_total_claimants_active(datamart_table: DatamartTable):
                 lazy=True,
                 folder_name="new_rfb_and_total_claimants_active",
             )
-            connector.save_as_table(summary_df, "new_rfb_and_total_claimants_active_summary")
+            # lazy=True returns the DataFrame itself
+            assert isinstance(summary_df, DataFrame)
+            if summary_columns:
+                summary_df = summary_df.select(summary_columns)
+            summary_job = connector.save_as_table(
+                summary_df, "new_rfb_and_total_claimants_active_summary", block=False
+            )
+
+            detail_job.result()
+            logger.info("Successfully created new_rfb_and_total_claimants_active_detail table")
+            summary_job.result()
             logger.info("Successfully created new_rfb_and_total_claimants_active_summary table")
 
             # Calculate execution time
-            execution_end = datetime.now()
-            duration = (execution_end - execution_start).total_seconds()
+            duration = time.perf_counter() - execution_start
             
             logger.info("Report generation completed successfully")
             logger.info(f"Total execution time: {duration:.2f} seconds")
 
 
     except Exception as e:
-        duration = (datetime.now() - execution_start).total_seconds()
+        duration = time.perf_counter() - execution_start
         logger.error(f"Report failed after {duration:.2f}s: {e}", exc_info=True)
         raise
 
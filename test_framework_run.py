@@ -1,15 +1,18 @@
 import argparse
-import os
+import functools
+from pathlib import Path
+from datamart_analytics.connector.snowpark_connector import SnowparkConnector
 from datamart_analytics.custom_exceptions.test_framework_exceptions import (
     CSVFileNotFoundException,
     LoadTestException,
     NoRowsValidatedException,
     UnhandledFrameworkException,
 )
-from datamart_analytics.environment import environment_configuration
+from datamart_analytics.environment import get_env
 from datamart_analytics.logger import logger
 from datamart_analytics.models.custom_models import SnowflakeCredentials
 from datamart_analytics.tools.test_framework_helper import (
+    ResultAccumulator,
     analyze_and_log_results,
     load_test_case_cross_reference_table,
     log_validated_row,
@@ -17,6 +20,28 @@ from datamart_analytics.tools.test_framework_helper import (
 )
 
 
+@functools.lru_cache(maxsize=4)
+def _make_credentials(
+    database_warehouse: str, source_database_name: str, table_schema_name: str
+) -> SnowflakeCredentials:
+    """
+    Build target credentials from the environment once per warehouse/database/schema.
+    """
+    environment_configuration = get_env()
+    return SnowflakeCredentials(
+        user=environment_configuration.snowflake_user_target,
+        password=environment_configuration.snowflake_password_target,
+        account=environment_configuration.snowflake_account,
+        role=environment_configuration.snowflake_role_target,
+        authenticator=environment_configuration.snowflake_authenticator,
+        private_key_file=environment_configuration.snowflake_private_key_file,
+        private_key_password=environment_configuration.snowflake_private_key_password,
+        warehouse=database_warehouse,
+        database=source_database_name,
+        table_schema=table_schema_name,
+    )
+
+
 def load_test(
     database_warehouse,
     source_database_name,
@@ -26,13 +51,23 @@ def load_test(
 ):
     """
     Load test cases and validate rows based on specifications.
+
+    Test cases run one at a time over the shared session, so SET statements of one
+    case never change session variables under another case's query.
     """
     try:
-        if not os.path.exists(specification_csv_path):
+        try:
+            specification_size = Path(specification_csv_path).stat().st_size
+        except FileNotFoundError:
             raise CSVFileNotFoundException(
                 f"Specification CSV file not found: {specification_csv_path}"
             )
 
+        if not specification_size:
+            raise NoRowsValidatedException(
+                f"Specification CSV file is empty: {specification_csv_path}"
+            )
+
         df = load_test_case_cross_reference_table(specification_csv_path)
 
         if df.empty:
@@ -40,31 +75,25 @@ def load_test(
                 "No rows found in the test specification DataFrame."
             )
 
-        snowflake_credentials = SnowflakeCredentials(
-            user=environment_configuration.snowflake_user_target,
-            password=environment_configuration.snowflake_password_target,
-            account=environment_configuration.snowflake_account,
-            role=environment_configuration.snowflake_role_target,
-            authenticator=environment_configuration.snowflake_authenticator,
-            private_key_file=environment_configuration.snowflake_private_key_file,
-            private_key_password=environment_configuration.snowflake_private_key_password,
-            warehouse=database_warehouse,
-            database=source_database_name,
-            table_schema=table_schema_name,
+        snowflake_credentials = _make_credentials(
+            database_warehouse, source_database_name, table_schema_name
         )
 
-        validated_rows = map_query_and_validate_test_case_data(
-            df, source_database_name, target_database_name
-        )
+        # One session for the whole run: validation and every logged row reuse it
+        with SnowparkConnector(snowflake_credentials) as connector:
+            validated_rows = map_query_and_validate_test_case_data(
+                df, source_database_name, target_database_name, connector
+            )
 
-        if not validated_rows:
-            raise NoRowsValidatedException("No rows were validated in the test.")
+            # Rows are validated lazily and results are tallied as they arrive
+            results = ResultAccumulator()
+            for row in validated_rows:
+                results.add(log_validated_row(row, connector))
 
-        result_list = []
-        for row in validated_rows:
-            result_list.append(log_validated_row(row, snowflake_credentials))
+            if not results.total:
+                raise NoRowsValidatedException("No rows were validated in the test.")
 
-        analyze_and_log_results(result_list)
+        analyze_and_log_results(results)
 
     except Exception as e:
         logger.error(f"An error occurred in load_test: {e}")
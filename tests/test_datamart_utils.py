@@ -0,0 +1,17 @@
+from types import SimpleNamespace
+
+import pytest
+
+from datamart_analytics.tools.datamart_utils import extract_and_validate_table_name
+
+
+@pytest.mark.unit
+def test_extract_table_name_skips_comment_line_ending_in_table(tmp_path):
+    sql_file = tmp_path / "ddl.sql"
+    sql_file.write_text(
+        "-- Build the staging TABLE\n"
+        "CREATE OR REPLACE TABLE db.sch.real_t (id INT);\n"
+    )
+    datamart_table = SimpleNamespace(target_database="db", target_schema="sch")
+
+    assert extract_and_validate_table_name(str(sql_file), datamart_table) == "real_t"
@@ -0,0 +1,29 @@
+import pytest
+
+from datamart_analytics.tools.test_framework_helper import parse_sql_file
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "block",
+    [
+        "-- START_TEST\n@NAME: a\n@QUERY: select 1\n-- END_TEST\n",
+        "-- START_TEST\n@QUERY: select 1\n@NAME: a\n-- END_TEST\n",
+    ],
+)
+def test_parse_sql_file_field_order_independent(tmp_path, block):
+    sql_file = tmp_path / "tests.sql"
+    sql_file.write_text(block)
+
+    assert parse_sql_file(str(sql_file)) == {"a": "select 1"}
+
+
+@pytest.mark.unit
+def test_parse_sql_file_block_fields_do_not_leak(tmp_path):
+    sql_file = tmp_path / "tests.sql"
+    sql_file.write_text(
+        "-- START_TEST\n@QUERY: select 0\n-- END_TEST\n"
+        "-- START_TEST\n@NAME: b\n@QUERY: select 2\n-- END_TEST\n"
+    )
+
+    assert parse_sql_file(str(sql_file)) == {"b": "select 2"}
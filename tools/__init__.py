@@ -7,6 +7,7 @@ configuration management, and test framework support.
 
 Classes:
     - ConfigurationLoader: Load and manage datamart configurations from YAML
+    - ResultAccumulator: Running tally of test framework results
 
 Functions:
     Datamart Utilities:
@@ -22,6 +23,7 @@ Functions:
         - load_profile_yaml: Load profile configurations
         - extract_and_validate_table_name: Extract and validate table names
         - check_table_exists: Check if a table exists
+        - check_tables_exist: Check several tables in a database or schema with one metadata query
         - create_target_credentials: Create target database credentials
         - create_source_credentials: Create source database credentials
         - create_datamart_table_parser: Create argument parser for reports
@@ -39,6 +41,7 @@ Functions:
 from datamart_analytics.tools.datamart_configuration import ConfigurationLoader
 from datamart_analytics.tools.datamart_utils import (
     check_table_exists,
+    check_tables_exist,
     create_and_parse_datamart_table_args,
     create_datamart_table_parser,
     create_source_credentials,
@@ -57,6 +60,7 @@ from datamart_analytics.tools.datamart_utils import (
     stage_table,
 )
 from datamart_analytics.tools.test_framework_helper import (
+    ResultAccumulator,
     analyze_and_log_results,
     build_and_map_sql_query_to_row,
     build_final_rendered_sql_query,
@@ -73,6 +77,7 @@ from datamart_analytics.tools.test_framework_helper import (
 
 __all__ = [
     "ConfigurationLoader",
+    "ResultAccumulator",
     "get_substitutions",
     "create_table_from_ddl",
     "stage_table",
@@ -85,6 +90,7 @@ __all__ = [
     "load_profile_yaml",
     "extract_and_validate_table_name",
     "check_table_exists",
+    "check_tables_exist",
     "create_target_credentials",
     "create_source_credentials",
     "create_datamart_table_parser",
@@ -1,3 +1,5 @@
+import functools
+import os
 from pathlib import Path
 from typing import Any
 import yaml
@@ -5,13 +7,46 @@ from datamart_analytics.custom_exceptions.configuration_exceptions import (
     ConfigurationFileNotFoundException,
     ConfigurationLoadException,
     ConfigurationValidationException,
-    TableConfigurationNotFoundException,
 )
 from datamart_analytics.models.custom_models import (
     DatamartConfiguration,
     TableConfiguration,
 )
 
+# libyaml-backed loader when PyYAML was built with it; same safe subset of YAML
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml(path: str) -> dict[str, Any] | None:
+    """
+    Parse a YAML file, reusing the cached result until the file is modified.
+
+    Args:
+        path (str): Resolved path of the YAML file.
+
+    Returns:
+        dict[str, Any] | None: Parsed YAML mapping, or None if the file holds no mapping.
+    """
+    return _load_yaml_cached(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict[str, Any] | None:
+    """
+    Parse a YAML file; cached per (path, mtime_ns) by _load_yaml, so an edited file is re-read.
+
+    Args:
+        path (str): Resolved path of the YAML file.
+        mtime_ns (int): Modification time of the file, part of the cache key only.
+
+    Returns:
+        dict[str, Any] | None: Parsed YAML mapping, or None if the file holds no mapping.
+        Callers must not mutate it.
+    """
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    return data if isinstance(data, dict) else None
+
 
 class ConfigurationLoader:
     """
@@ -25,6 +60,12 @@ class ConfigurationLoader:
         self.datamart_configuration: list[DatamartConfiguration] = (
             self._load_configuration()
         )
+        # Last definition of a name wins, as in the original full scan
+        self._by_name: dict[str, TableConfiguration] = {
+            table.name: table
+            for configuration in self.datamart_configuration
+            for table in configuration.tables
+        }
 
     @staticmethod
     def _load_configuration() -> list[DatamartConfiguration]:
@@ -44,8 +85,7 @@ class ConfigurationLoader:
         data: dict[str, Any] | None = None
 
         try:
-            with open(config_file_path, "r") as f:
-                data = yaml.safe_load(f)
+            data = _load_yaml(str(config_file_path.resolve()))
         except FileNotFoundError:
             raise ConfigurationFileNotFoundException(f"Configuration file not found: {config_file_path}")
         except yaml.YAMLError as e:
@@ -84,20 +124,5 @@ class ConfigurationLoader:
 
         Returns:
             TableConfiguration: The Table configuration that matches the provided name.
-
-        Raises:
-            Exception: If an error occurs while retrieving the Table by name.
         """
-        found_table: TableConfiguration | None = None
-
-        try:
-            for configuration in self.datamart_configuration:
-                for table in configuration.tables:
-                    if table.name == table_name:
-                        found_table = table
-        except Exception as e:
-            raise TableConfigurationNotFoundException(
-                f"An error occurred while retrieving table configuration '{table_name}': {e}"
-            )
-
-        return found_table
+        return self._by_name.get(table_name)
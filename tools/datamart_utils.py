@@ -1,6 +1,11 @@
 import argparse
+import functools
+import logging
+import mmap
+import os
 import re
 import uuid
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -10,7 +15,7 @@ from datamart_analytics.custom_exceptions.snowflake_exceptions import (
     SnowflakeQueryException,
     SnowflakeTableException,
 )
-from datamart_analytics.environment import environment_configuration
+from datamart_analytics.environment import get_env
 from datamart_analytics.logger import logger
 from datamart_analytics.models.custom_models import (
     DatamartTable,
@@ -34,6 +39,95 @@ from datamart_analytics.models.logging_models import ProcessLog
 TABLE_NAME_REGEX = re.compile(
     r"TABLE\s+[\[\\\"]?([a-zA-Z0-9_\-{}.]+)[\]\\\"]?", re.IGNORECASE
 )
+# Same pattern for scanning memory-mapped files; the separator is limited to
+# spaces/tabs so a line ending in TABLE cannot match a name on the next line
+TABLE_NAME_REGEX_BYTES = re.compile(
+    rb"TABLE[ \t]+[\[\\\"]?([a-zA-Z0-9_\-{}.]+)[\]\\\"]?", re.IGNORECASE
+)
+# Fully-qualified name in a CREATE [OR REPLACE] [TRANSIENT|TEMP] TABLE statement
+_CREATE_TABLE_RE = re.compile(
+    r"CREATE\s+(?:OR\s+REPLACE\s+)?(?:TRANSIENT\s+|TEMPORARY\s+|TEMP\s+)?TABLE\s+([\w]+)\.([\w]+)\.([\w]+)",
+    re.IGNORECASE,
+)
+
+# libyaml-backed loader when PyYAML was built with it; same safe subset of YAML
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Template variables used in SQL scripts and the DatamartTable attribute each one maps to
+_SUBSTITUTION_ATTRIBUTES: dict[str, str] = {
+    "{{TARGET_DATABASE}}": "target_database",
+    "{{TARGET_SCHEMA}}": "target_schema",
+    "{{CARRIER_NAME}}": "carrier_name",
+    "$carrier_name": "carrier_name",
+    "$CARRIER_NAME": "carrier_name",
+    "{{carrier_name}}": "carrier_name",
+    "{{SOURCE_DATABASE}}": "source_database",
+    "source_database": "source_database",
+    "{{WAREHOUSE}}": "warehouse",
+    "{{warehouse}}": "warehouse",
+    "{{REFRESH_TYPE}}": "refresh_type",
+    "{{FOLDER_NAME}}": "folder_name",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _substitution_pattern(keys: tuple[str, ...], flags: int = 0) -> re.Pattern[str]:
+    """
+    Compile one alternation matching any of the given template variables.
+
+    Longer keys come first so that e.g. {{SOURCE_DATABASE}} wins over source_database.
+
+    Args:
+        keys (tuple[str, ...]): Template variables to match.
+        flags (int): re flags, e.g. re.IGNORECASE.
+
+    Returns:
+        re.Pattern[str]: The compiled alternation.
+    """
+    return re.compile(
+        "|".join(re.escape(key) for key in sorted(keys, key=len, reverse=True)),
+        flags,
+    )
+
+
+def _substitute(sql: str, substitutions: dict[str, Any], ignore_case: bool) -> str:
+    """
+    Replace template variables in a single pass over the SQL string.
+
+    Args:
+        sql (str): SQL string with template variables.
+        substitutions (dict[str, Any]): Mapping of template variables to values; None values are skipped.
+        ignore_case (bool): Whether variables match regardless of case.
+
+    Returns:
+        str: SQL string with variables replaced.
+    """
+    values: dict[str, str] = {}
+    for key, value in substitutions.items():
+        if value is not None:
+            # As with sequential replacement, the first of several case variants wins
+            values.setdefault(key.lower() if ignore_case else key, str(value))
+
+    if not values:
+        return sql
+
+    # Most variables carry a {{ or $ marker; when the SQL has neither, only the
+    # unmarked keys can match, and plain substring checks rule those out cheaply
+    if "{{" not in sql and "$" not in sql:
+        haystack = sql.lower() if ignore_case else sql
+        if not any(
+            key in haystack for key in values if not key.startswith(("{{", "$"))
+        ):
+            return sql
+
+    pattern = _substitution_pattern(
+        tuple(substitutions), re.IGNORECASE if ignore_case else 0
+    )
+    if ignore_case:
+        return pattern.sub(
+            lambda match: values.get(match.group(0).lower(), match.group(0)), sql
+        )
+    return pattern.sub(lambda match: values.get(match.group(0), match.group(0)), sql)
 
 
 ## Equivalent to: Template variable mapping for SQL scripts
@@ -48,18 +142,8 @@ def get_substitutions(datamart_table: DatamartTable_integrated) -> dict:
         dict: Mapping of template variables to values.
     """
     return {
-        "{{TARGET_DATABASE}}": getattr(datamart_table, "target_database", None),
-        "{{TARGET_SCHEMA}}": getattr(datamart_table, "target_schema", None),
-        "{{CARRIER_NAME}}": getattr(datamart_table, "carrier_name", None),
-        "$carrier_name": getattr(datamart_table, "carrier_name", None),
-        "$CARRIER_NAME": getattr(datamart_table, "carrier_name", None),
-        "{{carrier_name}}": getattr(datamart_table, "carrier_name", None),
-        "{{SOURCE_DATABASE}}": getattr(datamart_table, "source_database", None),
-        "source_database": getattr(datamart_table, "source_database", None),
-        "{{WAREHOUSE}}": getattr(datamart_table, "warehouse", None),
-        "{{warehouse}}": getattr(datamart_table, "warehouse", None),
-        "{{REFRESH_TYPE}}": getattr(datamart_table, "refresh_type", None),
-        "{{FOLDER_NAME}}": getattr(datamart_table, "folder_name", None),
+        key: getattr(datamart_table, attribute, None)
+        for key, attribute in _SUBSTITUTION_ATTRIBUTES.items()
     }
 
 
@@ -82,9 +166,7 @@ def create_table_from_ddl(
         Exception: If the DDL execution fails.
     """
     if substitutions:
-        for key, value in substitutions.items():
-            if value is not None:
-                ddl_sql = ddl_sql.replace(key, str(value))
+        ddl_sql = _substitute(ddl_sql, substitutions, ignore_case=False)
 
     try:
         session.sql(ddl_sql).collect()
@@ -158,16 +240,17 @@ def generate_merge_sql(
         raise ValueError("Both columns and pk_col must be provided.")
 
     # Build ON condition
-    on_conditions = [f"tgt.{col} = src.{col}" for col in pk_col]
-    on_condition = " AND ".join(on_conditions)
+    on_condition = " AND ".join(f"tgt.{col} = src.{col}" for col in pk_col)
 
-    # Build UPDATE SET clause (exclude primary keys)
-    update_columns = [col for col in columns if col not in pk_col]
-    update_set_clause = ", ".join([f"{col} = src.{col}" for col in update_columns])
+    # Build UPDATE SET clause (exclude primary keys; set lookup keeps this O(columns))
+    pk_set = frozenset(pk_col)
+    update_set_clause = ", ".join(
+        f"{col} = src.{col}" for col in columns if col not in pk_set
+    )
 
     # Build INSERT clause
     insert_columns = ", ".join(columns)
-    insert_values = ", ".join([f"src.{col}" for col in columns])
+    insert_values = ", ".join(f"src.{col}" for col in columns)
 
     merge_sql = f"""
     MERGE INTO {target_db}.{target_schema}.{target_table} tgt
@@ -206,18 +289,13 @@ def execute_merge(
         Exception: If the merge fails.
     """
     try:
-        session.sql(merge_sql).collect()
-        result = session.sql(
-            "SELECT * FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))"
-        ).collect()
+        # MERGE returns its own single-row summary; no RESULT_SCAN round-trip needed.
+        # The update column is absent when the MERGE has no WHEN MATCHED UPDATE clause.
+        result = session.sql(merge_sql).collect()
+        merge_counts = result[0].as_dict() if result else {}
 
-        rows_inserted = 0
-        rows_updated = 0
-
-        for row in result:
-            row_dict = row.as_dict()
-            rows_inserted += row_dict.get("rows_inserted", 0)
-            rows_updated += row_dict.get("rows_updated", 0)
+        rows_inserted = merge_counts.get("number of rows inserted", 0)
+        rows_updated = merge_counts.get("number of rows updated", 0)
 
         end_time = datetime.now()
         process_log = ProcessLog(
@@ -309,11 +387,7 @@ def extract_table_name_from_ddl(ddl_sql: str) -> str:
     Raises:
         ValueError: If the table name cannot be extracted.
     """
-    pattern = re.compile(
-        r"CREATE\s+(?:OR\s+REPLACE\s+)?(?:TRANSIENT\s+|TEMPORARY\s+|TEMP\s+)?TABLE\s+([\w]+)\.([\w]+)\.([\w]+)",
-        re.IGNORECASE,
-    )
-    match = pattern.search(ddl_sql)
+    match = _CREATE_TABLE_RE.search(ddl_sql)
 
     if not match:
         raise ValueError("Could not extract table name from DDL.")
@@ -334,11 +408,7 @@ def replace_template_vars_case_insensitive(sql: str, substitutions: dict) -> str
     Returns:
         str: SQL string with variables replaced.
     """
-    for key, value in substitutions.items():
-        if value is not None:
-            pattern = re.compile(re.escape(key), re.IGNORECASE)
-            sql = pattern.sub(str(value), sql)
-    return sql
+    return _substitute(sql, substitutions, ignore_case=True)
 
 
 ## Equivalent to: Read and preprocess CREATE TABLE ...
@@ -355,22 +425,36 @@ def read_and_substitute_ddl(
     Returns:
         str: DDL SQL with variables replaced.
     """
-    with open(ddl_path) as ddl_file:
-        ddl_sql = ddl_file.read()
+    ddl_sql = Path(ddl_path).read_text()
 
     substitutions = get_substitutions(datamart_table)
     final_sql = replace_template_vars_case_insensitive(ddl_sql, substitutions)
 
     # Print/log the final SQL for debugging (only for fact table DDLs)
-    if "fact" in str(ddl_path).lower():
+    if logger.isEnabledFor(logging.INFO) and "fact" in str(ddl_path).lower():
         logger.info(f"Final SQL for fact table from ({ddl_path}):\n{final_sql}")
 
     return final_sql
 
 
+@functools.lru_cache(maxsize=1)
+def _find_configuration_folder() -> Path | None:
+    """
+    Search the project for the 'configuration' folder; the tree walk runs once per process.
+
+    Returns:
+        Path | None: The first 'configuration' folder found, or None.
+    """
+    project_root = Path(__file__).parent.parent
+    return next(project_root.rglob("configuration"), None)
+
+
+@functools.lru_cache(maxsize=None)
 def load_profile_yaml(folder: str) -> dict:
     """
     Load a YAML configuration file and return its contents as a dictionary.
+    Results are cached per folder name; callers must not mutate the returned dictionary.
+    Use load_profile_yaml.cache_clear() to force a re-read.
 
     Parameters:
         folder (str): The folder name where the YAML file is located.
@@ -384,10 +468,7 @@ def load_profile_yaml(folder: str) -> dict:
     """
     try:
         # Search for the 'configuration' folder anywhere in the project
-        project_root = Path(__file__).parent.parent
-        configuration_folder = next(
-            project_root.rglob("configuration"), None
-        )
+        configuration_folder = _find_configuration_folder()
 
         if not configuration_folder:
             raise FileNotFoundError(
@@ -400,7 +481,7 @@ def load_profile_yaml(folder: str) -> dict:
             raise FileNotFoundError(f"YAML file not found: {yaml_file}")
 
         with open(yaml_file) as file:
-            return yaml.safe_load(file)
+            return yaml.load(file, Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         raise RuntimeError(f"Error parsing YAML file: {e}")
 
@@ -419,61 +500,108 @@ def extract_and_validate_table_name(
         Optional[str]: Extracted table name if valid, otherwise None.
     """
     try:
-        with open(file_path, "r") as file:
-            for line in file:
-                match = TABLE_NAME_REGEX.search(line)
-                if match:
-                    full_table_name = match.group(1)
-
-                    # Check if table name is parameterized
-                    if "{{" in full_table_name:
-                        # Extract the last part after the last dot
-                        parts = full_table_name.split(".")
-                        if parts:
-                            return parts[-1]
-
-                    # Validate fully qualified name
-                    parts = full_table_name.split(".")
-
-                    if len(parts) == 3:
-                        # Fully qualified name: database.schema.table
-                        database_name, schema_name, table_name = parts
-                        if database_name != datamart_table.target_database:
-                            logger.error(
-                                f"Database name '{database_name}' in the SQL file does not match the runtime database '{datamart_table.target_database}'"
-                            )
-                            return None
-                        if schema_name != datamart_table.target_schema:
-                            logger.error(
-                                f"Schema name '{schema_name}' in the SQL file does not match the runtime schema '{datamart_table.target_schema}'"
-                            )
-                            return None
-                        logger.info(f"Extracted table name: {table_name}")
-                        return table_name
-                    elif len(parts) == 2:
-                        # Partially qualified name: schema.table
-                        schema_name, table_name = parts
-                        if schema_name != datamart_table.target_schema:
-                            logger.error(
-                                f"Schema name '{schema_name}' in the SQL file does not match the runtime schema '{datamart_table.target_schema}'"
-                            )
-                            return None
-                        logger.info(f"Extracted table name: {table_name}")
-                        return table_name
-                    else:
-                        # Only table name is provided
-                        table_name = parts[0]
-                        logger.info(f"Extracted table name: {table_name}")
-                        return table_name
-
-        # If no match is found, log an error
-        logger.error(f"Table name not found in file: {file_path}")
-        return None
+        # One regex scan over the mapped file instead of a Python loop over its lines
+        full_table_name: str | None = None
+        with open(file_path, "rb") as file:
+            # mmap cannot map an empty file
+            if os.fstat(file.fileno()).st_size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    match = TABLE_NAME_REGEX_BYTES.search(mapped)
+                    if match:
+                        full_table_name = match.group(1).decode()
+
+        if full_table_name is None:
+            # If no match is found, log an error
+            logger.error(f"Table name not found in file: {file_path}")
+            return None
+
+        # Check if table name is parameterized
+        if "{{" in full_table_name:
+            # Extract the last part after the last dot
+            parts = full_table_name.split(".")
+            if parts:
+                return parts[-1]
+
+        # Validate fully qualified name
+        parts = full_table_name.split(".")
+
+        if len(parts) == 3:
+            # Fully qualified name: database.schema.table
+            database_name, schema_name, table_name = parts
+            if database_name != datamart_table.target_database:
+                logger.error(
+                    f"Database name '{database_name}' in the SQL file does not match the runtime database '{datamart_table.target_database}'"
+                )
+                return None
+            if schema_name != datamart_table.target_schema:
+                logger.error(
+                    f"Schema name '{schema_name}' in the SQL file does not match the runtime schema '{datamart_table.target_schema}'"
+                )
+                return None
+            logger.info(f"Extracted table name: {table_name}")
+            return table_name
+        elif len(parts) == 2:
+            # Partially qualified name: schema.table
+            schema_name, table_name = parts
+            if schema_name != datamart_table.target_schema:
+                logger.error(
+                    f"Schema name '{schema_name}' in the SQL file does not match the runtime schema '{datamart_table.target_schema}'"
+                )
+                return None
+            logger.info(f"Extracted table name: {table_name}")
+            return table_name
+        else:
+            # Only table name is provided
+            table_name = parts[0]
+            logger.info(f"Extracted table name: {table_name}")
+            return table_name
     except Exception as e:
         logger.error(f"Error extracting table name from file {file_path}: {e}")
         raise
 
 
+def check_tables_exist(
+    session: Session,
+    table_names: Iterable[str],
+    database: str | None = None,
+    schema: str | None = None,
+) -> set[str]:
+    """
+    Check several tables at once with one INFORMATION_SCHEMA query per call.
+    Nothing is cached, so tables created or dropped since are always reflected.
+
+    Args:
+        session (Session): Snowflake session/connection.
+        table_names (Iterable[str]): Names of the tables to check.
+        database (str | None): Database to look in; the session's current database if None.
+        schema (str | None): Schema to look in; every schema of the database if None.
+
+    Returns:
+        set[str]: The given names (as passed) whose tables exist.
+    """
+    table_names = list(table_names)
+    if not table_names:
+        return set()
+
+    upper_names = sorted({name.upper() for name in table_names})
+    # Values are bound rather than formatted in; IDENTIFIER() resolves the view name
+    query = (
+        "SELECT UPPER(TABLE_NAME) FROM IDENTIFIER(?)"
+        " WHERE TABLE_TYPE NOT IN ('VIEW', 'MATERIALIZED VIEW')"
+        f" AND UPPER(TABLE_NAME) IN ({', '.join(['?'] * len(upper_names))})"
+    )
+    params: list[str] = [
+        f"{database}.INFORMATION_SCHEMA.TABLES" if database else "INFORMATION_SCHEMA.TABLES",
+        *upper_names,
+    ]
+    if schema:
+        query += " AND TABLE_SCHEMA = UPPER(?)"
+        params.append(schema)
+
+    existing = {row[0] for row in session.sql(query, params=params).collect()}
+    return {name for name in table_names if name.upper() in existing}
+
+
 def check_table_exists(session: Session, table_name: str) -> bool:
     """
     Check if a table exists in Snowflake.
@@ -486,8 +614,7 @@ def check_table_exists(session: Session, table_name: str) -> bool:
         bool: True if the table exists, False otherwise.
     """
     try:
-        result = session.sql(f"SHOW TABLES LIKE '{table_name}'").collect()
-        return len(result) > 0
+        return bool(check_tables_exist(session, [table_name]))
     except Exception as e:
         logger.error(f"Error checking if table '{table_name}' exists: {e}")
         return False
@@ -515,6 +642,7 @@ def create_target_credentials(datamart_table: DatamartTable) -> SnowflakeCredent
         >>> with SnowparkConnector(credentials) as connector:
         ...     # Use connector
     """
+    environment_configuration = get_env()
     return SnowflakeCredentials(
         user=environment_configuration.snowflake_user_target,
         password=environment_configuration.snowflake_password_target,
@@ -550,6 +678,7 @@ def create_source_credentials(datamart_table: DatamartTable) -> SnowflakeCredent
         >>> with SnowparkConnector(credentials) as connector:
         ...     # Use connector
     """
+    environment_configuration = get_env()
     return SnowflakeCredentials(
         user=environment_configuration.snowflake_user_source,
         password=environment_configuration.snowflake_password_source,
@@ -565,6 +694,25 @@ def create_source_credentials(datamart_table: DatamartTable) -> SnowflakeCredent
 
 
 # Argument parsing utilities for DatamartTable reports
+# Standard DatamartTable CLI arguments: (flag, required, help); optional ones default to None
+_DATAMART_TABLE_ARGS: tuple[tuple[str, bool, str], ...] = (
+    ("--source_database", True, "Source database name"),
+    ("--source_schema", True, "Source schema name"),
+    ("--target_database", True, "Target database name"),
+    ("--target_schema", True, "Target schema name"),
+    ("--carrier_name", True, "Carrier name for the report"),
+    ("--target_warehouse", True, "Target warehouse name"),
+    ("--source_warehouse", False, "Source warehouse name (optional)"),
+    ("--target_table", False, "Target table name (optional - reports may create multiple tables)"),
+    ("--report_start_dt", False, "Report start datetime (YYYY-MM-DD HH:MM:SS, optional)"),
+    ("--report_end_dt", False, "Report end datetime (YYYY-MM-DD HH:MM:SS, optional)"),
+    ("--source_table", False, "Source table name (optional)"),
+    ("--last_load_date", False, "Last load date for incremental data extraction (YYYY-MM-DD HH:MM:SS)"),
+    ("--as_of_run_dt", False, "As of run datetime (YYYY-MM-DD HH:MM:SS)"),
+    ("--report_run_dt", False, "Report run datetime (YYYY-MM-DD HH:MM:SS)"),
+)
+
+
 def create_datamart_table_parser(report_name: str) -> argparse.ArgumentParser:
     """
     Create an ArgumentParser with standard DatamartTable arguments.
@@ -588,93 +736,11 @@ def create_datamart_table_parser(report_name: str) -> argparse.ArgumentParser:
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
-    # Required arguments
-    parser.add_argument(
-        "--source_database",
-        type=str,
-        required=True,
-        help="Source database name",
-    )
-    parser.add_argument(
-        "--source_schema",
-        type=str,
-        required=True,
-        help="Source schema name",
-    )
-    parser.add_argument(
-        "--target_database",
-        type=str,
-        required=True,
-        help="Target database name",
-    )
-    parser.add_argument(
-        "--target_schema",
-        type=str,
-        required=True,
-        help="Target schema name",
-    )
-    parser.add_argument(
-        "--carrier_name",
-        type=str,
-        required=True,
-        help="Carrier name for the report",
-    )
-    parser.add_argument(
-        "--target_warehouse",
-        type=str,
-        required=True,
-        help="Target warehouse name",
-    )
-
-    # Optional arguments
-    parser.add_argument(
-        "--source_warehouse",
-        type=str,
-        default=None,
-        help="Source warehouse name (optional)",
-    )
-    parser.add_argument(
-        "--target_table",
-        type=str,
-        default=None,
-        help="Target table name (optional - reports may create multiple tables)",
-    )
-    parser.add_argument(
-        "--report_start_dt",
-        type=str,
-        default=None,
-        help="Report start datetime (YYYY-MM-DD HH:MM:SS, optional)",
-    )
-    parser.add_argument(
-        "--report_end_dt",
-        type=str,
-        default=None,
-        help="Report end datetime (YYYY-MM-DD HH:MM:SS, optional)",
-    )
-    parser.add_argument(
-        "--source_table",
-        type=str,
-        default=None,
-        help="Source table name (optional)",
-    )
-    parser.add_argument(
-        "--last_load_date",
-        type=str,
-        default=None,
-        help="Last load date for incremental data extraction (YYYY-MM-DD HH:MM:SS)",
-    )
-    parser.add_argument(
-        "--as_of_run_dt",
-        type=str,
-        default=None,
-        help="As of run datetime (YYYY-MM-DD HH:MM:SS)",
-    )
-    parser.add_argument(
-        "--report_run_dt",
-        type=str,
-        default=None,
-        help="Report run datetime (YYYY-MM-DD HH:MM:SS)",
-    )
+    for flag, required, help_text in _DATAMART_TABLE_ARGS:
+        if required:
+            parser.add_argument(flag, type=str, required=True, help=help_text)
+        else:
+            parser.add_argument(flag, type=str, default=None, help=help_text)
 
     return parser
 
@@ -1,7 +1,11 @@
 import ast
+import functools
+import importlib.util
 import json
+import os
 import re
-from typing import Any
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal
 import pandas as pd
 from datamart_analytics.custom_exceptions.test_framework_exceptions import (
     NoTestResultsException,
@@ -16,7 +20,22 @@ from datamart_analytics.models.test_framework_models import TestCaseMetadata
 from pydantic import ValidationError
 from datamart_analytics.connector.snowpark_connector import SnowparkConnector
 from datamart_analytics.logger import logger
-from datamart_analytics.models.custom_models import SnowflakeCredentials
+
+# pyarrow's multithreaded CSV reader when available (it ships with the snowflake
+# connector's pandas extra); otherwise pandas' C parser
+_CSV_ENGINE: Literal["pyarrow", "c"] = (
+    "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+)
+
+# Test case block markers and fields in SQL template files; @NAME and @QUERY are
+# searched independently within a block, so their order does not matter
+_TEST_CASE_RE = re.compile(r"-- START_TEST(.*?)-- END_TEST", re.DOTALL)
+_NAME_RE = re.compile(r"@NAME\s*:\s*(\w+)")
+_QUERY_RE = re.compile(r"@QUERY\s*:\s*(.*?)(?=@|$)", re.DOTALL)
+# Rows of a failing test case's result included in its logged DETAILS
+_DETAILS_LIMIT = 10
+# {placeholder} in a mapped SQL query
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z0-9_]+)\}")
 
 
 def load_test_case_cross_reference_table(csv_path: str) -> pd.DataFrame:
@@ -29,11 +48,26 @@ def load_test_case_cross_reference_table(csv_path: str) -> pd.DataFrame:
 
     Returns:
         pd.DataFrame: DataFrame containing only enabled test cases.
+
+    Raises:
+        TestCaseValidationException: If the CSV header has no is_enabled column.
     """
-    df = pd.read_csv(csv_path, keep_default_na=False)
-    df = df[df["is_enabled"] == True]  # type: ignore
-    df = df.reset_index(drop=True)
-    return df
+    # Check the header before parsing the whole file
+    header = pd.read_csv(csv_path, nrows=0)
+    if "is_enabled" not in header.columns:
+        raise TestCaseValidationException(
+            f"Specification CSV has no 'is_enabled' column: {csv_path}"
+        )
+
+    df = pd.read_csv(csv_path, keep_default_na=False, engine=_CSV_ENGINE)
+
+    # is_enabled parses as bool only when every cell is True/False; a blank cell leaves
+    # it as strings, so match "true" case-insensitively instead of comparing to True
+    enabled = df["is_enabled"]
+    if enabled.dtype != bool:
+        enabled = enabled.astype(str).str.strip().str.lower() == "true"
+
+    return df.loc[enabled].reset_index(drop=True)
 
 
 def generate_set_statements(params_dict: dict[str, str]) -> list[str]:
@@ -59,12 +93,28 @@ def parse_set_params(set_params_str: str) -> dict:
     Returns:
         dict: Parsed dictionary, or empty dict if parsing fails.
     """
+    if isinstance(set_params_str, dict):
+        return set_params_str
+
     if not set_params_str or set_params_str.strip().lower() == "none":
         return {}
 
-    if isinstance(set_params_str, dict):
-        return set_params_str
+    params = _literal_eval_cached(set_params_str)
+    # Copy so callers cannot mutate the cached value
+    return dict(params) if isinstance(params, dict) else params
+
+
+@functools.lru_cache(maxsize=256)
+def _literal_eval_cached(set_params_str: str) -> Any:
+    """
+    ast.literal_eval of a set_params string; rows usually repeat a few payloads.
+
+    Args:
+        set_params_str (str): String representation of a dictionary.
 
+    Returns:
+        Any: The evaluated literal, or an empty dict if it does not parse.
+    """
     try:
         return ast.literal_eval(set_params_str)
     except (ValueError, SyntaxError):
@@ -117,6 +167,7 @@ def create_set_statements(
 def parse_sql_file(path: str) -> dict[str, str]:
     """
     Parses the SQL file and extracts the blocks of @NAME and @QUERY pairs.
+    Parsed files are cached by path and modification time, so rows sharing a file parse it once.
 
     Args:
         path (str): Path to SQL file.
@@ -124,47 +175,74 @@ def parse_sql_file(path: str) -> dict[str, str]:
     Returns:
         Dict[str, str]: Returns the mapping of @NAME to the SQL query.
     """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError as e:
+        raise TestCaseParseException(f"Error parsing SQL file: {e}")
+
+    # Copy so callers cannot mutate the cached mapping
+    return dict(_parse_sql_file_cached(path, mtime_ns))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_sql_file_cached(path: str, mtime_ns: int) -> dict[str, str]:
+    """
+    Parse a SQL test case file; cached per (path, mtime_ns) by parse_sql_file.
+
+    Args:
+        path (str): Path to SQL file.
+        mtime_ns (int): Modification time of the file, part of the cache key only.
+
+    Returns:
+        Dict[str, str]: Mapping of @NAME to the SQL query.
+    """
     try:
         with open(path) as file:
             sql_text = file.read()
 
-        # Pattern to match test case blocks
-        test_case_pattern = r"-- START_TEST(.*?)-- END_TEST"
-        test_case_blocks = re.findall(test_case_pattern, sql_text, re.DOTALL)
-
         name_query_mapping: dict[str, str] = {}
 
-        for test_case_block in test_case_blocks:
-            try:
-                # Extract @NAME
-                name_match = re.search(r"@NAME\s*:\s*(\w+)", test_case_block)
-                if not name_match:
-                    continue
-
-                test_case_name = name_match.group(1)
+        for block_match in _TEST_CASE_RE.finditer(sql_text):
+            test_case_block = block_match.group(1)
 
-                # Extract @QUERY
-                query_match = re.search(
-                    r"@QUERY\s*:\s*(.*?)(?=@|$)", test_case_block, re.DOTALL
-                )
-                if not query_match:
-                    continue
+            name_match = _NAME_RE.search(test_case_block)
+            if not name_match:
+                continue
 
-                sql_query = query_match.group(1).strip()
+            query_match = _QUERY_RE.search(test_case_block)
+            if not query_match:
+                continue
 
-                name_query_mapping[test_case_name] = sql_query
-            except (AttributeError, ValidationError) as e:
-                raise TestCaseParseException(
-                    f"Error parsing test case: {e}\nBlock: \n{test_case_block}\n"
-                ) from e
+            name_query_mapping[name_match.group(1)] = query_match.group(1).strip()
 
         return name_query_mapping
     except Exception as e:
         raise TestCaseParseException(f"Error parsing SQL file: {e}")
 
 
+def _table_fqn(row_dict: dict, prefix: str) -> str | None:
+    """
+    Fully qualified name from a row's <prefix>_database/schema/table_name fields.
+
+    Args:
+        row_dict (dict): Test case row.
+        prefix (str): "target" or "source".
+
+    Returns:
+        str | None: "database.schema.table", or None if any part is missing or empty.
+    """
+    database = row_dict.get(f"{prefix}_database_name")
+    schema = row_dict.get(f"{prefix}_schema_name")
+    table = row_dict.get(f"{prefix}_table_name")
+    if database and schema and table:
+        return f"{database}.{schema}.{table}"
+    return None
+
+
 def build_final_rendered_sql_query(
-    final_row_dict: dict, snowflake_credentials: SnowflakeCredentials
+    final_row_dict: dict,
+    snowpark_connector: SnowparkConnector,
+    schema_cache: dict[str, set[str]] | None = None,
 ) -> str:
     """
     Builds the final SQL query by filling placeholders in mapped_sql_query using values from final_row_dict.
@@ -172,52 +250,66 @@ def build_final_rendered_sql_query(
 
     Args:
         final_row_dict (dict): The row dictionary containing all required parameters.
-        snowflake_credentials (SnowflakeCredentials): Snowflake credentials for connection.
+        snowpark_connector (SnowparkConnector): Open connector whose session is reused for the lookup.
+        schema_cache (dict[str, set[str]] | None): Column names by fully qualified table name,
+            shared across rows so each table's schema is described only once.
 
     Returns:
         str: The rendered SQL query string.
     """
     if final_row_dict["test_case_type"] == TestCaseType.DATA_TESTING:
-        with SnowparkConnector(
-            snowflake_credentials=snowflake_credentials
-        ) as sq:
-            if (
-                final_row_dict.get("target_database_name")
-                and final_row_dict.get("target_schema_name")
-                and final_row_dict.get("target_table_name")
-            ):
-                df = sq.session.table(
-                    f"{final_row_dict['target_database_name']}.{final_row_dict['target_schema_name']}.{final_row_dict['target_table_name']}"
-                )
-            else:
-                df = sq.session.table(
-                    f"{final_row_dict['source_database_name']}.{final_row_dict['source_schema_name']}.{final_row_dict['source_table_name']}"
-                )
-
-            columns = [field.name for field in df.schema.fields]
+        fqn = _table_fqn(final_row_dict, "target") or _table_fqn(final_row_dict, "source")
+        if fqn is None:
+            raise TestCaseValidationException(
+                f"No target or source table for test case '{final_row_dict.get('test_case_name')}'"
+            )
 
-            if "carrier_name" in columns:
-                final_row_dict["carrier_name_condition"] = (
-                    f"carrier_name = '{final_row_dict['carrier_name']}'"
-                )
-            elif "carrier_name_dim_id" in columns:
-                final_row_dict["carrier_name_condition"] = (
-                    f"carrier_name_dim_id = MD5('{final_row_dict['carrier_name']}')"
-                )
-            else:
-                final_row_dict["carrier_name_condition"] = "1=1"
+        if schema_cache is None:
+            schema_cache = {}
+        columns = schema_cache.get(fqn)
+        if columns is None:
+            # One DESCRIBE round trip per distinct table, not per test case
+            columns = {
+                field.name
+                for field in snowpark_connector.session.table(fqn).schema.fields
+            }
+            schema_cache[fqn] = columns
+
+        if "carrier_name" in columns:
+            final_row_dict["carrier_name_condition"] = (
+                f"carrier_name = '{final_row_dict['carrier_name']}'"
+            )
+        elif "carrier_name_dim_id" in columns:
+            final_row_dict["carrier_name_condition"] = (
+                f"carrier_name_dim_id = MD5('{final_row_dict['carrier_name']}')"
+            )
+        else:
+            final_row_dict["carrier_name_condition"] = "1=1"
 
     final_row_dict = create_column_conditions_for_final_rendered_query(
         final_row_dict
     )
 
-    template = final_row_dict.get("mapped_sql_query", "")
+    template: str = final_row_dict.get("mapped_sql_query", "")
+
+    # No placeholders: skip the regex pass
+    if "{" not in template:
+        return template
+
+    # Stringify each referenced value once, however often its placeholder repeats
+    rendered_values: dict[str, str] = {}
 
     def replacer(match):
         key = match.group(1)
-        return str(final_row_dict.get(key, match.group(0)))
+        value = rendered_values.get(key)
+        if value is None:
+            if key not in final_row_dict:
+                # Unknown placeholders are left verbatim
+                return match.group(0)
+            value = rendered_values[key] = str(final_row_dict[key])
+        return value
 
-    filled_query = re.sub(r"\{([A-Za-z0-9_]+)\}", replacer, template)
+    filled_query = _PLACEHOLDER_RE.sub(replacer, template)
 
     return filled_query
 
@@ -225,7 +317,8 @@ def build_final_rendered_sql_query(
 def build_and_map_sql_query_to_row(
     row_dict: dict,
     sql_template: dict,
-    snowflake_credentials: SnowflakeCredentials,
+    snowpark_connector: SnowparkConnector,
+    schema_cache: dict[str, set[str]] | None = None,
 ) -> dict:
     """
     Maps the SQL query from sql_template to the row_dict based on test_case_name.
@@ -234,7 +327,8 @@ def build_and_map_sql_query_to_row(
     Args:
         row_dict (dict): The row dictionary.
         sql_template (dict): Dictionary mapping test case names to SQL queries.
-        snowflake_credentials (SnowflakeCredentials): Snowflake credentials.
+        snowpark_connector (SnowparkConnector): Open connector shared across rows.
+        schema_cache (dict[str, set[str]] | None): Column names by table, shared across rows.
 
     Returns:
         dict: The updated row_dict with mapped and final SQL queries.
@@ -251,7 +345,7 @@ def build_and_map_sql_query_to_row(
 
     row_dict["mapped_sql_query"] = sql_query
     row_dict["final_rendered_sql_query"] = build_final_rendered_sql_query(
-        row_dict, snowflake_credentials
+        row_dict, snowpark_connector, schema_cache
     )
 
     return row_dict
@@ -261,39 +355,56 @@ def map_query_and_validate_test_case_data(
     df: pd.DataFrame,
     source_database_name: str,
     target_database_name: str,
-    snowflake_credentials: SnowflakeCredentials,
-) -> list[dict]:
+    snowpark_connector: SnowparkConnector,
+) -> Iterator[dict]:
     """
     For each row in the DataFrame, map the corresponding SQL query from the SQL template file
     (using test_case_name as the key), add it to the row as 'mapped_sql_query', and validate
     the row using the TestCaseMetadata pydantic schema.
+    Rows are yielded as they are validated, so callers can consume them without holding
+    the whole validated set in memory.
 
     Args:
         df (pd.DataFrame): DataFrame containing test case data.
         source_database_name (str): Source database name.
         target_database_name (str): Target database name.
-        snowflake_credentials (SnowflakeCredentials): Snowflake credentials.
+        snowpark_connector (SnowparkConnector): Open connector shared across rows.
 
-    Returns:
-        List[Dict]: List of validated test case dictionaries.
+    Yields:
+        dict: Validated test case dictionaries.
 
     Raises:
         SQLFileNotFoundException: If the SQL file path is missing.
         SQLTemplateNotFoundException: If no SQL templates are found.
         TestCaseValidationException: If validation fails.
     """
-    validated_rows: list[dict] = []
-
-    for _, row in df.iterrows():
-        row_dict = row.to_dict()
+    schema_cache: dict[str, set[str]] = {}
+    # Parsed templates per file for this run, independent of parse_sql_file's LRU size
+    # and of row order; rows are not sorted by file so test cases keep their CSV order
+    templates_by_path: dict[str, dict[str, str]] = {}
+
+    # Strip whitespace from headers and text cells once, column-wise; .str.strip yields
+    # NaN for non-string cells in mixed columns, so those fall back to the original value
+    df = df.rename(columns=str.strip)
+    text_columns = df.select_dtypes(include=["object", "string"]).columns
+    if len(text_columns):
+        df[text_columns] = df[text_columns].apply(
+            lambda col: col.str.strip().fillna(col)
+        )
+    source_database_name = source_database_name.strip()
+    target_database_name = target_database_name.strip()
 
+    # Plain dicts per row; iterrows would build (and dtype-cast) a Series for every row
+    for row_dict in df.to_dict(orient="records"):
         sql_file_path = row_dict.get("query_file_path")
         if not sql_file_path:
             raise SQLFileNotFoundException(
                 f"query_file_path is missing for row: {row_dict.get('test_case_name')}"
             )
 
-        sql_templates = parse_sql_file(sql_file_path)
+        sql_templates = templates_by_path.get(sql_file_path)
+        if sql_templates is None:
+            sql_templates = templates_by_path[sql_file_path] = parse_sql_file(sql_file_path)
         if not sql_templates:
             raise SQLTemplateNotFoundException(
                 f"No SQL templates found in file: {sql_file_path}"
@@ -303,14 +414,8 @@ def map_query_and_validate_test_case_data(
         row_dict["source_database_name"] = source_database_name
         row_dict["target_database_name"] = target_database_name
 
-        # Strip whitespace from keys and values
-        row_dict = {
-            k.strip(): (v.strip() if isinstance(v, str) else v)
-            for k, v in row_dict.items()
-        }
-
         final_row_dict = build_and_map_sql_query_to_row(
-            row_dict, sql_templates, snowflake_credentials
+            row_dict, sql_templates, snowpark_connector, schema_cache
         )
 
         # Parse set_params
@@ -322,8 +427,7 @@ def map_query_and_validate_test_case_data(
                 final_row_dict["set_params"] = {}
 
         try:
-            validated_params = TestCaseMetadata(**final_row_dict)
-            validated_rows.append(validated_params.model_dump())
+            validated_params = TestCaseMetadata.model_validate(final_row_dict)
         except (KeyError, ValidationError) as e:
             raise TestCaseValidationException(
                 f"Validation failed for row with test_case_name '{row_dict.get('test_case_name')}': {str(e)}"
@@ -333,7 +437,7 @@ def map_query_and_validate_test_case_data(
                 f"Error processing row with test_case_name '{row_dict.get('test_case_name')}': {str(e)}"
             )
 
-    return validated_rows
+        yield validated_params.model_dump()
 
 
 def format_column(col: str) -> str:
@@ -382,33 +486,18 @@ def create_column_conditions_for_final_rendered_query(
     target_columns_values = row_dict.get("target_column_name", "").strip()
 
     if source_columns_values:
-        columns_values = source_columns_values
         columns = [col.strip() for col in source_columns_values.split(",")]
         row_dict[
             "source_column_name"
         ] = source_columns_values  # keep as comma-separated string for SQL
     elif target_columns_values:
-        columns_values = target_columns_values
         columns = [col.strip() for col in target_columns_values.split(",")]
         row_dict[
             "target_column_name"
         ] = target_columns_values  # keep as comma-separated string for SQL
     else:
-        columns_values = ""
         columns = []
 
-    # For backward compatibility
-    source_columns = (
-        [col.strip() for col in source_columns_values.split(",")]
-        if source_columns_values
-        else []
-    )
-    target_columns = (
-        [col.strip() for col in target_columns_values.split(",")]
-        if target_columns_values
-        else []
-    )
-
     test_case_upper = row_dict.get("test_case_name", "").upper()
 
     if test_case_upper == "UNIQUE_CHECK" or test_case_upper == "COMBINATION_COLUMN_UNIQUE_CHECK":
@@ -480,8 +569,21 @@ def create_column_conditions_for_final_rendered_query(
     return row_dict
 
 
+def _json_dumps_indented(obj: Any) -> str:
+    """
+    Serialize obj as 2-space indented JSON for the result boxes.
+
+    Args:
+        obj (Any): Object to serialize; unsupported values are rendered with str().
+
+    Returns:
+        str: The JSON text.
+    """
+    return json.dumps(obj, indent=2, default=str)
+
+
 def log_validated_row(
-    validated_row: dict[str, Any], snowflake_credentials: SnowflakeCredentials
+    validated_row: dict[str, Any], snowpark_connector: SnowparkConnector
 ) -> tuple[str, str, str, int] | None:
     """
     Logs the test result in JSON format with table, columns, and test_results.
@@ -490,7 +592,8 @@ def log_validated_row(
 
     Args:
         validated_row (dict[str, Any]): The validated test case row.
-        snowflake_credentials (SnowflakeCredentials): Snowflake credentials.
+        snowpark_connector (SnowparkConnector): Open connector shared across rows, so each
+            test case reuses one authenticated session instead of opening its own.
 
     Returns:
         tuple[str, str, str, int] | None: Tuple containing table_name, test_case_name, status, and failure_count.
@@ -499,22 +602,10 @@ def log_validated_row(
     block_sep = "\n" + "=" * 100
 
     # Determine table name
+    table_name = None
     if validated_row["test_case_type"] == TestCaseType.DATA_TESTING:
-        if (
-            validated_row.get("target_database_name")
-            and validated_row.get("target_schema_name")
-            and validated_row.get("target_table_name")
-        ):
-            table_name = f"{validated_row['target_database_name']}.{validated_row['target_schema_name']}.{validated_row['target_table_name']}"
-        elif (
-            validated_row.get("source_database_name")
-            and validated_row.get("source_schema_name")
-            and validated_row.get("source_table_name")
-        ):
-            table_name = f"{validated_row['source_database_name']}.{validated_row['source_schema_name']}.{validated_row['source_table_name']}"
-        else:
-            table_name = validated_row.get("fact_table_name", "UNKNOWN")
-    else:
+        table_name = _table_fqn(validated_row, "target") or _table_fqn(validated_row, "source")
+    if table_name is None:
         table_name = validated_row.get("fact_table_name", "UNKNOWN")
 
     # Extract columns
@@ -532,34 +623,42 @@ def log_validated_row(
     result_json["columns"] = columns
     result_json["TEST_RESULTS"] = []
 
+    # Session variables set for this test case, unset once its result is read
+    set_variables: list[str] = []
+
     # Execute query
     try:
         query = validated_row.get("final_rendered_sql_query")
         if not query:
             raise Exception("final_rendered_sql_query is missing")
 
-        with SnowparkConnector(
-            snowflake_credentials=snowflake_credentials
-        ) as sq:
-            if validated_row.get("is_set"):
-                set_statements = create_set_statements(
-                    validated_row.get("is_set"),
-                    validated_row.get("set_params"),
+        if validated_row.get("is_set"):
+            set_statements = create_set_statements(
+                validated_row.get("is_set"),
+                validated_row.get("set_params"),
+            )
+            if set_statements:
+                set_variables = list(parse_set_params(validated_row["set_params"]))
+                all_statements = set_statements + [query]
+                result_df = snowpark_connector.execute_multiple_statements(
+                    all_statements, lazy=True
                 )
-                if set_statements:
-                    all_statements = set_statements + [query]
-                    result_df = sq.execute_multiple_statements(
-                        all_statements, lazy=True
-                    )
-                else:
-                    result_df = sq.execute_query(query, lazy=True)
             else:
-                result_df = sq.execute_query(query, lazy=True)
+                result_df = snowpark_connector.execute_query(query, lazy=True)
+        else:
+            result_df = snowpark_connector.execute_query(query, lazy=True)
 
-            if result_df is not None and hasattr(result_df, "collect"):
-                result_df = result_df.collect()
-            else:
-                raise Exception("Invalid result from query execution")
+        if result_df is None or not hasattr(result_df, "to_local_iterator"):
+            raise Exception("Invalid result from query execution")
+
+        # Run the query once, as written, and stream its rows: only the first few are
+        # kept for the report and the rest are just counted
+        result_rows = []
+        total_rows = 0
+        for row in result_df.to_local_iterator():
+            if total_rows < _DETAILS_LIMIT:
+                result_rows.append(row)
+            total_rows += 1
 
     except Exception as e:
         test_result = {
@@ -570,7 +669,7 @@ def log_validated_row(
         }
         result_json["TEST_RESULTS"].append(test_result)
 
-        json_str = json.dumps(result_json, indent=2, default=str)
+        json_str = _json_dumps_indented(result_json)
         box_width = max(len(line) for line in json_str.split("\n")) + 4
 
         table_box = f"""
@@ -580,32 +679,31 @@ def log_validated_row(
 """
         logger.info(table_box)
         return None
+    finally:
+        # The session is shared across test cases; don't leak this case's variables.
+        # One at a time: a SET batch that failed part-way leaves some never set, and
+        # a failed UNSET must not abort the remaining test cases.
+        for variable in set_variables:
+            try:
+                snowpark_connector.execute_query(f"UNSET {variable}", lazy=False)
+            except Exception as e:
+                logger.warning(f"Could not unset session variable {variable}: {e}")
 
     # Determine test result based on test case type and query result
     failure_count = 0
     details: list[dict] = []
     status = "PASS"
 
-    if result_df:
-        dict_list = [row.as_dict() if hasattr(row, "as_dict") else dict(row) for row in result_df]
-        df = pd.DataFrame(dict_list)
+    if result_rows:
+        # At most _DETAILS_LIMIT rows, so plain dicts; a DataFrame here is pure overhead
+        details = [row.as_dict() if hasattr(row, "as_dict") else dict(row) for row in result_rows]
 
-        if not df.empty:
-            failure_count = (
-                df.iloc[0].get("err_count", len(df))
-                if "err_count" in df.columns
-                else len(df)
-            )
-            status = "FAIL" if failure_count > 0 else "PASS"
-            details = df.head(10).to_dict("records")
+        if "err_count" in details[0]:
+            # A NULL err_count counts as no failures
+            failure_count = details[0]["err_count"] or 0
         else:
-            failure_count = 0
-            status = "PASS"
-            details = []
-    else:
-        failure_count = 0
-        status = "PASS"
-        details = []
+            failure_count = total_rows
+        status = "FAIL" if failure_count > 0 else "PASS"
 
     test_result = {
         "TEST_CASE_NAME": validated_row.get("test_case_name", "UNKNOWN"),
@@ -616,7 +714,7 @@ def log_validated_row(
 
     result_json["TEST_RESULTS"].append(test_result)
 
-    json_str = json.dumps(result_json, indent=2, default=str)
+    json_str = _json_dumps_indented(result_json)
     box_width = max(len(line) for line in json_str.split("\n")) + 4
 
     table_box = f"""
@@ -629,65 +727,74 @@ def log_validated_row(
     return (table_name, validated_row.get("test_case_name", "UNKNOWN"), status, failure_count)
 
 
-def analyze_and_log_results(result_list: list) -> None:
+class ResultAccumulator:
+    """
+    Running tally of log_validated_row results.
+
+    Only failed results are retained, so memory stays flat however many test cases run.
+    """
+
+    def __init__(self) -> None:
+        self.total: int = 0
+        self.failed_rows: list[tuple[str, str, str, int]] = []
+
+    def add(self, result: tuple[str, str, str, int] | None) -> None:
+        """
+        Count a result and keep it if the test case failed.
+
+        Args:
+            result (tuple[str, str, str, int] | None): Result from log_validated_row.
+        """
+        self.total += 1
+        if result is not None and len(result) >= 3 and str(result[2]).upper() == "FAIL":
+            self.failed_rows.append(result)
+
+
+def analyze_and_log_results(
+    result_list: Iterable[tuple[str, str, str, int] | None] | ResultAccumulator,
+) -> None:
     """
     Analyze the result list, log each result, and raise exception if any test case failed.
 
     Args:
-        result_list (list): List of test results.
+        result_list (Iterable | ResultAccumulator): Test results, or an accumulator that
+            already tallied them while the test cases ran.
 
     Raises:
         NoTestResultsException: If no test results are provided.
         OneOrMoreTestCasesFailedException: If one or more test cases failed.
     """
-    if not result_list:
+    if isinstance(result_list, ResultAccumulator):
+        accumulator = result_list
+    else:
+        accumulator = ResultAccumulator()
+        for result in result_list:
+            accumulator.add(result)
+
+    if not accumulator.total:
         raise NoTestResultsException("No test results to analyze.")
 
-    failed_rows = [
-        row
-        for row in result_list
-        if row is not None and len(row) >= 3 and str(row[2]).upper() == "FAIL"
-    ]
+    failed_rows = accumulator.failed_rows
 
     if not failed_rows:
         return
 
-    # Build table for failed tests
+    # Build table for failed tests: stringify each cell once, then one format spec per row
     headers = ["TABLE_NAME", "TEST_CASE_NAME", "STATUS", "COUNT"]
-    col_widths = [len(h) for h in headers]
-
-    for row in failed_rows:
-        for i, val in enumerate(row[:4]):
-            if i < len(col_widths):
-                col_widths[i] = max(col_widths[i], len(str(val)))
-
-    sep = "+" + "+".join(["-" * (w + 2) for w in col_widths]) + "+"
-    header_row = (
-        "|"
-        + "|".join(
-            [
-                f" {headers[i]:<{col_widths[i]}} "
-                for i in range(len(headers))
-            ]
-        )
-        + "|"
-    )
-
-    table_lines = [sep, header_row, sep]
+    cells = [
+        [str(row[i]) if i < len(row) else "" for i in range(len(headers))]
+        for row in failed_rows
+    ]
+    col_widths = [
+        max(len(header), *(len(cell[i]) for cell in cells))
+        for i, header in enumerate(headers)
+    ]
 
-    for row in failed_rows:
-        row_line = (
-            "|"
-            + "|".join(
-                [
-                    f" {str(row[i] if i < len(row) else ''):<{col_widths[i]}} "
-                    for i in range(len(headers))
-                ]
-            )
-            + "|"
-        )
-        table_lines.append(row_line)
+    sep = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
+    row_fmt = "|" + "|".join(f" {{:<{w}}} " for w in col_widths) + "|"
 
+    table_lines = [sep, row_fmt.format(*headers), sep]
+    table_lines.extend(row_fmt.format(*cell) for cell in cells)
     table_lines.append(sep)
     table_str = "\n".join(table_lines)
 